@@ -207,6 +207,15 @@ LOGIN_URL = '/login/'
 LOGIN_REDIRECT_URL = '/dashboard/faculty/'
 LOGOUT_REDIRECT_URL = '/login/'
 
+# Where submission answers are stored: 'rows' (one ResponseAnswer per answer)
+# or 'document' (FormResponse.answers_doc, with ResponseAnswer rows kept only
+# for rating/slider scores used by SQL analytics). Reads handle both.
+ANSWER_STORAGE_MODE = env('ANSWER_STORAGE_MODE', default='rows')
+
+# Queue finalized peer evaluations and store them with
+# `manage.py drain_submission_queue` instead of inside the request
+SUBMISSION_QUEUE_ENABLED = env.bool('SUBMISSION_QUEUE_ENABLED', default=False)
+
 # Site URL
 SITE_URL = env('SITE_URL', default='http://127.0.0.1:8000')
 
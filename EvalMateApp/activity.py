@@ -0,0 +1,91 @@
+"""
+Recent-activity feed for the faculty overview.
+
+The submit path appends one FacultyActivity row per submission (not per
+teammate rated) for the form's owner, in the same transaction as the
+responses. Each faculty member keeps at most FEED_CAP rows: older ones are
+trimmed on insert, so the feed never grows with the submission history.
+
+The overview reads the newest rows through the (faculty, -created_at) index
+with a fixed LIMIT and keeps the latest entry per student.
+"""
+from django.db.models import Max, Min, Q
+from django.utils import timezone
+
+from .models import FacultyActivity, FormResponse
+
+FEED_CAP = 50
+RECENT_LIMIT = 3
+# Rows scanned to find RECENT_LIMIT distinct students
+RECENT_SCAN = 20
+
+
+def _trim(faculty_id):
+    # Delete everything older than the FEED_CAP-th newest row
+    boundary = list(FacultyActivity.objects.filter(faculty_id=faculty_id).order_by(
+        '-created_at', '-id'
+    ).values_list('created_at', 'id')[FEED_CAP - 1:FEED_CAP])
+    if not boundary:
+        return
+    created_at, activity_id = boundary[0]
+    FacultyActivity.objects.filter(faculty_id=faculty_id).filter(
+        Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=activity_id)
+    ).delete()
+
+
+def record_submission(form, student, team_identifier, response_ids, submitted_at=None):
+    """Append a submission to the form owner's feed; run inside the submit transaction"""
+    if not response_ids or not form.created_by_id:
+        return
+    FacultyActivity.objects.create(
+        faculty_id=form.created_by_id,
+        form=form,
+        student=student,
+        response_id=min(response_ids),
+        team_identifier=team_identifier,
+        created_at=submitted_at or timezone.now(),
+    )
+    _trim(form.created_by_id)
+
+
+def recent_activity(faculty, limit=RECENT_LIMIT):
+    """Latest submission of the ``limit`` most recent distinct submitters"""
+    rows = FacultyActivity.objects.filter(faculty=faculty).select_related(
+        'form', 'student'
+    ).defer('form__structure', 'form__compiled_schema').order_by('-created_at', '-id')[:RECENT_SCAN]
+
+    recent = []
+    seen = set()
+    for row in rows:
+        if row.student_id in seen:
+            continue
+        seen.add(row.student_id)
+        recent.append(row)
+        if len(recent) == limit:
+            break
+    return recent
+
+
+def backfill(faculty):
+    """Rebuild a faculty member's feed from their stored responses; returns rows written"""
+    groups = FormResponse.objects.filter(
+        form__created_by=faculty, submitted_by__isnull=False,
+    ).values('form_id', 'submitted_by_id', 'team_identifier').annotate(
+        last_submitted_at=Max('submitted_at'),
+        first_id=Min('id'),
+    ).order_by('-last_submitted_at', '-first_id')[:FEED_CAP]
+
+    rows = [
+        FacultyActivity(
+            faculty=faculty,
+            form_id=group['form_id'],
+            student_id=group['submitted_by_id'],
+            response_id=group['first_id'],
+            team_identifier=group['team_identifier'],
+            created_at=group['last_submitted_at'],
+        )
+        for group in groups
+    ]
+    FacultyActivity.objects.filter(faculty=faculty).delete()
+    FacultyActivity.objects.bulk_create(rows)
+    return len(rows)
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Profile, FormTemplate, FormResponse, ResponseAnswer, PendingEvaluation
+from .models import Profile, FormTemplate, FormResponse, ResponseAnswer, PendingEvaluation, FacultyActivity
 
 
 @admin.register(Profile)
@@ -9,7 +9,7 @@ class ProfileAdmin(admin.ModelAdmin):
 
 @admin.register(FormTemplate)
 class FormTemplateAdmin(admin.ModelAdmin):
-	list_display = ('title', 'course_id', 'created_by', 'created_at', 'privacy')
+	list_display = ('title', 'course_id', 'created_by', 'created_at', 'due_at', 'privacy')
 	search_fields = ('title', 'course_id', 'institution')
 
 
@@ -27,3 +27,10 @@ class ResponseAnswerAdmin(admin.ModelAdmin):
 @admin.register(PendingEvaluation)
 class PendingEvaluationAdmin(admin.ModelAdmin):
 	list_display = ('student', 'form', 'added_at', 'status')
+	list_select_related = ('student__user', 'form')
+
+
+@admin.register(FacultyActivity)
+class FacultyActivityAdmin(admin.ModelAdmin):
+	list_display = ('faculty', 'student', 'form', 'created_at')
+	list_select_related = ('faculty__user', 'student__user', 'form')
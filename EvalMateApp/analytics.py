@@ -0,0 +1,286 @@
+"""
+Score analytics for rating and slider questions.
+
+Scores are aggregated in SQL on the typed ResponseAnswer columns
+(question_id, numeric_value): a form is reduced to one (teammate, question,
+value) -> count row per distinct score, and means, spreads, medians and
+histograms are computed from those counts with NumPy. Results are cached per
+form and data version, so a new submission or a structure edit (both bump the
+form's version) is picked up on the next read.
+
+Cross-form student trajectories use one grouped query over all of a faculty
+member's forms, cached under the versions of those forms.
+"""
+import hashlib
+
+import numpy as np
+from django.core.cache import cache
+from django.db.models import Count, F, Q, Sum
+
+from .models import FormTemplate, ResponseAnswer
+from .answer_matrix import NUMERIC_TYPES
+from . import versions
+
+SLIDER_BINS = 10
+CACHE_TTL = 60 * 60  # 1 hour; entries are also invalidated by the form version
+
+
+def numeric_questions(structure):
+    """Rating/slider questions of a form structure with their value range"""
+    questions = []
+    sections = structure.get('sections', []) if isinstance(structure, dict) else []
+    for section in sections:
+        for question in section.get('questions', []):
+            if question.get('type') not in NUMERIC_TYPES or question.get('id') is None:
+                continue
+            options = question.get('options') or {}
+            if question['type'] == 'rating':
+                low, high = 1, options.get('max', 5)
+            else:
+                low, high = options.get('min', 0), options.get('max', 100)
+            questions.append({
+                'id': str(question['id']),
+                'text': question.get('text', 'Question'),
+                'type': question['type'],
+                'min': _to_float(low) or 0.0,
+                'max': _to_float(high) or 0.0,
+            })
+    return questions
+
+
+def _to_float(value):
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if np.isfinite(number) else None
+
+
+def load_score_counts(form, questions):
+    """{question id: {teammate name: (values, counts)}} from one grouped query"""
+    ids = [int(q['id']) for q in questions if q['id'].isdigit()]
+    rows = ResponseAnswer.objects.filter(
+        response__form=form,
+        question_id__in=ids,
+        numeric_value__isnull=False,
+    ).values_list(
+        'question_id', 'response__teammate_name', 'numeric_value',
+    ).annotate(n=Count('id')).order_by()
+
+    grouped = {}
+    for question_id, teammate, value, n in rows:
+        per_teammate = grouped.setdefault(str(question_id), {})
+        values, counts = per_teammate.setdefault(teammate or '', ([], []))
+        values.append(value)
+        counts.append(n)
+    return grouped
+
+
+def _histogram(values, counts, question):
+    if question['type'] == 'rating':
+        low, high = int(question['min']), int(question['max'])
+        labels = list(range(low, high + 1))
+        buckets = np.clip(np.rint(values).astype(np.int64) - low, 0, len(labels) - 1)
+        totals = np.bincount(buckets, weights=counts, minlength=len(labels)).astype(np.int64)
+        return {'labels': labels, 'counts': totals.tolist()}
+
+    totals, edges = np.histogram(values, bins=SLIDER_BINS, range=(question['min'], question['max']),
+                                 weights=counts)
+    labels = [f'{edges[i]:g}–{edges[i + 1]:g}' for i in range(len(totals))]
+    return {'labels': labels, 'counts': totals.astype(np.int64).tolist()}
+
+
+def _weighted_median(values, counts, total):
+    # Same as np.median over the expanded values: mean of the middle one or two
+    cumulative = np.cumsum(counts)
+    low = values[np.searchsorted(cumulative, (total - 1) // 2, side='right')]
+    high = values[np.searchsorted(cumulative, total // 2, side='right')]
+    return (low + high) / 2
+
+
+def _summarize(values, counts, question):
+    """Count/mean/median/std/range/histogram of value counts"""
+    if not len(values):
+        return {'count': 0, 'mean': None, 'median': None, 'std': None,
+                'min': None, 'max': None, 'histogram': None}
+    order = np.argsort(values)
+    values = np.asarray(values, dtype=float)[order]
+    counts = np.asarray(counts, dtype=np.int64)[order]
+    total = int(counts.sum())
+    mean = float(np.dot(values, counts) / total)
+    std = float(np.sqrt(np.dot(counts, (values - mean) ** 2) / total))
+    return {
+        'count': total,
+        'mean': round(mean, 2),
+        'median': round(float(_weighted_median(values, counts, total)), 2),
+        'std': round(std, 2),
+        'min': float(values[0]),
+        'max': float(values[-1]),
+        'histogram': _histogram(values, counts, question),
+    }
+
+
+def _merge(groups):
+    """Concatenate several (values, counts) pairs"""
+    values, counts = [], []
+    for group_values, group_counts in groups:
+        values.extend(group_values)
+        counts.extend(group_counts)
+    return values, counts
+
+
+def compute_form_analytics(form):
+    """Per-question and per-teammate score statistics for a form"""
+    questions = numeric_questions(form.structure)
+    if not questions:
+        return {'questions': [], 'teammates': []}
+
+    grouped = load_score_counts(form, questions)
+
+    question_data = []
+    for question in questions:
+        per_teammate = grouped.get(question['id'], {})
+        question_data.append(dict(question, **_summarize(*_merge(per_teammate.values()), question)))
+
+    # Group by teammate (case/whitespace-insensitive)
+    names = {}
+    by_teammate = {}
+    for question_id, per_teammate in grouped.items():
+        for name, value_counts in per_teammate.items():
+            key = name.strip().casefold()
+            names.setdefault(key, name.strip())
+            by_teammate.setdefault(key, {}).setdefault(question_id, []).append(value_counts)
+
+    teammates = []
+    for key, per_question in by_teammate.items():
+        summaries = {
+            q['id']: _summarize(*_merge(per_question.get(q['id'], [])), q) for q in questions
+        }
+        teammates.append({
+            'name': names[key],
+            'responses': max(s['count'] for s in summaries.values()),
+            'questions': summaries,
+        })
+    teammates.sort(key=lambda t: t['name'].casefold())
+
+    return {'questions': question_data, 'teammates': teammates}
+
+
+def form_analytics(form):
+    """Cached ``compute_form_analytics`` keyed by form id and data version"""
+    version = versions.get_version('form', form.id)
+    cache_key = f'form_analytics:{form.id}:{version}'
+    result = cache.get(cache_key)
+    if result is None:
+        result = compute_form_analytics(form)
+        cache.set(cache_key, result, CACHE_TTL)
+    return result
+
+
+def teammate_lookup(analytics):
+    """Index analytics['teammates'] by normalized teammate name"""
+    return {t['name'].casefold(): t for t in analytics['teammates']}
+
+
+def _trajectory_point(questions, sums, counts):
+    """Per-question means of one role (received/given) and their 0-100 average"""
+    question_data = []
+    weighted, answered = 0.0, 0
+    for question in questions:
+        count = counts.get(question['id'], 0)
+        if not count:
+            continue
+        mean = sums[question['id']] / count
+        question_data.append({'id': question['id'], 'text': question['text'],
+                              'type': question['type'], 'mean': round(mean, 2), 'count': count})
+        span = question['max'] - question['min']
+        if span > 0:
+            weighted += (mean - question['min']) / span * 100 * count
+            answered += count
+    if not question_data:
+        return None
+    return {
+        'count': sum(q['count'] for q in question_data),
+        'percent': round(weighted / answered, 1) if answered else None,
+        'questions': question_data,
+    }
+
+
+def compute_student_trajectory(faculty, student):
+    """Scores a student received and gave on each of ``faculty``'s forms, oldest first.
+
+    Scores received are matched on the evaluated teammate's name, since the
+    evaluation flow stores teammates by name only.
+    """
+    forms = list(FormTemplate.objects.filter(created_by=faculty).only(
+        'id', 'title', 'created_at', 'structure'
+    ).order_by('created_at', 'id'))
+    questions = {form.id: numeric_questions(form.structure) for form in forms}
+    question_ids = {
+        int(q['id']) for form_questions in questions.values() for q in form_questions if q['id'].isdigit()
+    }
+
+    student_name = f'{student.first_name} {student.last_name}'.strip()
+    received = Q(response__teammate_name__iexact=student_name) if student_name else Q(pk__in=[])
+    given = Q(response__submitted_by=student)
+
+    # One grouped query across every form: (form, question) -> sums and counts per role
+    rows = ResponseAnswer.objects.filter(
+        received | given,
+        response__form__created_by=faculty,
+        question_id__in=question_ids,
+        numeric_value__isnull=False,
+    ).values(
+        'question_id', form_id=F('response__form_id'),
+    ).annotate(
+        received_sum=Sum('numeric_value', filter=received),
+        received_count=Count('id', filter=received),
+        given_sum=Sum('numeric_value', filter=given),
+        given_count=Count('id', filter=given),
+    ).order_by()
+
+    totals = {}
+    for row in rows:
+        form_totals = totals.setdefault(row['form_id'], {'received': ({}, {}), 'given': ({}, {})})
+        question_id = str(row['question_id'])
+        for role in ('received', 'given'):
+            sums, counts = form_totals[role]
+            sums[question_id] = row[f'{role}_sum'] or 0.0
+            counts[question_id] = row[f'{role}_count']
+
+    trajectory = []
+    for form in forms:
+        if form.id not in totals:
+            continue
+        trajectory.append({
+            'form_id': form.id,
+            'title': form.title,
+            'created_at': form.created_at.isoformat(),
+            'received': _trajectory_point(questions[form.id], *totals[form.id]['received']),
+            'given': _trajectory_point(questions[form.id], *totals[form.id]['given']),
+        })
+
+    received_percents = [p['received']['percent'] for p in trajectory
+                         if p['received'] and p['received']['percent'] is not None]
+    return {
+        'student': {'id': student.id, 'name': student_name},
+        'forms': trajectory,
+        'change': round(received_percents[-1] - received_percents[0], 1) if len(received_percents) > 1 else None,
+    }
+
+
+def student_trajectory(faculty, student):
+    """Cached ``compute_student_trajectory`` keyed by the versions of the faculty's forms"""
+    form_ids = list(FormTemplate.objects.filter(created_by=faculty).order_by('id').values_list('id', flat=True))
+    form_versions = versions.get_versions('form', form_ids)
+    # Received scores are matched by name, so a renamed student gets a new entry
+    fingerprint = hashlib.md5('|'.join([
+        ','.join(f'{k}:{v}' for k, v in form_versions.items()),
+        f'{student.first_name} {student.last_name}',
+    ]).encode('utf-8')).hexdigest()
+    cache_key = f'student_trajectory:{faculty.id}:{student.id}:{fingerprint}'
+    result = cache.get(cache_key)
+    if result is None:
+        result = compute_student_trajectory(faculty, student)
+        cache.set(cache_key, result, CACHE_TTL)
+    return result
@@ -0,0 +1,120 @@
+"""
+In-memory answer index shared by the report and history views.
+
+Answers are stored under either 'question_<id>' (evaluation flow) or '<id>'
+keys. Everything here normalizes to '<id>' so callers can look answers and
+questions up without caring which form a row was saved with.
+
+Responses saved in document mode carry their answers in
+FormResponse.answers_doc; the rest are read from ResponseAnswer rows.
+"""
+import math
+from collections import defaultdict
+
+from .models import FormResponse, ResponseAnswer
+
+# Question types whose answers are numeric scores
+NUMERIC_TYPES = ('rating', 'slider')
+
+
+def normalize_question_key(key):
+    """Map both 'question_<id>' and '<id>' answer keys to '<id>'"""
+    key = str(key)
+    if key.startswith('question_'):
+        return key[len('question_'):]
+    return key
+
+
+def question_number(key):
+    """Integer id of a 'question_<id>' / '<id>' answer key, or None for other keys"""
+    key = normalize_question_key(key)
+    return int(key) if key.isdigit() else None
+
+
+def numeric_answer(answer, question):
+    """Score of a rating/slider answer as a float, or None"""
+    if not question or question.get('type') not in NUMERIC_TYPES:
+        return None
+    try:
+        value = float(answer)
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def typed_answer(key, answer, question_map):
+    """(question_id, numeric_value) stored next to a ResponseAnswer's text"""
+    return question_number(key), numeric_answer(answer, question_map.get(normalize_question_key(key)))
+
+
+def question_index(structure):
+    """Return (questions in display order, {normalized id: question})"""
+    questions = []
+    by_key = {}
+    sections = structure.get('sections', []) if isinstance(structure, dict) else []
+    for section in sections:
+        for question in section.get('questions', []):
+            question_id = question.get('id')
+            if question_id:
+                questions.append(question)
+                by_key[normalize_question_key(question_id)] = question
+    return questions, by_key
+
+
+class AnswerMatrix:
+    """(response_id, normalized question key) -> answer, built from one query"""
+
+    def __init__(self, rows=()):
+        self._cells = {}
+        self._by_response = defaultdict(list)
+        for response_id, question, answer in rows:
+            self.add(response_id, question, answer)
+
+    @classmethod
+    def for_responses(cls, responses):
+        """Load the answers of ``responses`` (objects or ids).
+
+        Answers documents already loaded on the objects are used as is; rows
+        of the other responses are read from ResponseAnswer in one query.
+        """
+        matrix = cls()
+        documents = {}
+        unloaded = []
+        for response in responses:
+            if isinstance(response, int) or 'answers_doc' in response.get_deferred_fields():
+                unloaded.append(getattr(response, 'id', response))
+            else:
+                documents[response.id] = response.answers_doc
+        if unloaded:
+            documents.update(FormResponse.objects.filter(id__in=unloaded).values_list('id', 'answers_doc'))
+
+        row_ids = []
+        for response_id, document in documents.items():
+            if document is None:
+                row_ids.append(response_id)
+            else:
+                matrix.add_document(response_id, document)
+
+        if row_ids:
+            rows = ResponseAnswer.objects.filter(
+                response_id__in=row_ids
+            ).order_by('id').values_list('response_id', 'question', 'answer')
+            for response_id, question, answer in rows:
+                matrix.add(response_id, question, answer)
+        return matrix
+
+    def add_document(self, response_id, document):
+        for question, answer in document:
+            self.add(response_id, question, answer)
+
+    def add(self, response_id, question, answer):
+        self._cells[(response_id, normalize_question_key(question))] = answer
+        self._by_response[response_id].append((question, answer))
+
+    def get(self, response_id, question_id, default=None):
+        """Answer of ``response_id`` to a question, accepting either key form"""
+        return self._cells.get((response_id, normalize_question_key(question_id)), default)
+
+    def answers_for(self, response_id):
+        """(stored question key, answer) pairs of a response in saved order"""
+        return self._by_response.get(response_id, [])
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class EvalmateappConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'EvalMateApp'
+
+    def ready(self):
+        # Load the search-as-you-type indexes when a worker serves its first request
+        from django.core.signals import request_started
+        from .autocomplete import warm_on_first_request
+        request_started.connect(warm_on_first_request, dispatch_uid='autocomplete_warm')
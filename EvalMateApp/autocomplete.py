@@ -0,0 +1,137 @@
+"""
+In-process autocomplete index for search-as-you-type.
+
+Each worker keeps, per institution, the published forms and a sorted array
+of (token, form id) pairs built from the normalized title and course id
+words. A keystroke query is a few ``bisect`` prefix lookups and a set
+intersection in memory, without a database round-trip.
+
+Partitions are loaded for every institution on the worker's first request
+(``warm``) and reloaded lazily after an invalidation. Publish, unpublish,
+edit and delete call ``forms_changed``, which drops the partition in this
+worker and bumps the institution's data version; other workers compare
+that version at most every VERSION_CHECK_INTERVAL seconds and reload when
+it moved.
+"""
+import bisect
+import re
+import threading
+import time
+
+from .models import FormTemplate
+from . import versions
+
+MAX_RESULTS = 10
+VERSION_CHECK_INTERVAL = 5  # seconds
+PUBLISHED = ('institution', 'institution_course')
+ENTRY_FIELDS = ('id', 'title', 'course_id', 'privacy', 'passcode', 'created_at', 'due_at', 'is_closed')
+
+_TOKEN_RE = re.compile(r'\w+')
+_indexes = {}
+_lock = threading.Lock()
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall((text or '').casefold())
+
+
+class InstitutionIndex:
+    """Prefix index over the published forms of one institution"""
+
+    def __init__(self, forms, version):
+        self.version = version
+        self.checked_at = time.monotonic()
+        self.forms = {}
+        pairs = []
+        for form in forms:
+            self.forms[form['id']] = form
+            for token in set(tokenize(form['title']) + tokenize(form['course_id'])):
+                pairs.append((token, form['id']))
+        pairs.sort()
+        self.tokens = [token for token, _ in pairs]
+        self.form_ids = [form_id for _, form_id in pairs]
+
+    def prefix_matches(self, prefix):
+        """Ids of forms with a word starting with ``prefix``"""
+        low = bisect.bisect_left(self.tokens, prefix)
+        high = bisect.bisect_left(self.tokens, prefix + '\uffff')
+        return set(self.form_ids[low:high])
+
+    def search(self, query, limit=MAX_RESULTS):
+        """Forms where every query word prefixes one of their words, newest first"""
+        ids = None
+        for token in tokenize(query):
+            matches = self.prefix_matches(token)
+            ids = matches if ids is None else ids & matches
+            if not ids:
+                return []
+        if not ids:
+            return []
+        forms = sorted((self.forms[i] for i in ids), key=lambda f: (f['created_at'], f['id']), reverse=True)
+        return forms[:limit]
+
+
+def _load(institution, version):
+    forms = FormTemplate.objects.filter(
+        institution=institution, privacy__in=PUBLISHED,
+    ).values(*ENTRY_FIELDS)
+    return InstitutionIndex(forms, version)
+
+
+def get_index(institution):
+    """This worker's index for an institution, reloaded if another worker changed it"""
+    index = _indexes.get(institution)
+    now = time.monotonic()
+    if index is not None and now - index.checked_at < VERSION_CHECK_INTERVAL:
+        return index
+
+    version = versions.get_version('institution', institution)
+    if index is not None and index.version == version:
+        index.checked_at = now
+        return index
+
+    index = _load(institution, version)
+    with _lock:
+        _indexes[institution] = index
+    return index
+
+
+def search(institution, query, limit=MAX_RESULTS):
+    if not institution:
+        return []
+    return get_index(institution).search(query, limit)
+
+
+def forms_changed(*institutions):
+    """Invalidate the indexes of institutions whose published forms changed"""
+    institutions = {i for i in institutions if i}
+    versions.bump('institution', *institutions)
+    with _lock:
+        for institution in institutions:
+            _indexes.pop(institution, None)
+
+
+def warm():
+    """Build every institution's index from one query"""
+    # Versions first: a change made while loading bumps them again
+    current = versions.scope_versions('institution')
+    by_institution = {}
+    rows = FormTemplate.objects.filter(privacy__in=PUBLISHED).exclude(institution='').values(
+        'institution', *ENTRY_FIELDS
+    )
+    for row in rows:
+        by_institution.setdefault(row.pop('institution'), []).append(row)
+    with _lock:
+        for institution, forms in by_institution.items():
+            _indexes[institution] = InstitutionIndex(forms, current.get(institution, 0))
+
+
+def warm_on_first_request(sender, **kwargs):
+    """request_started receiver that warms the indexes once per worker"""
+    from django.core.signals import request_started
+    request_started.disconnect(dispatch_uid='autocomplete_warm')
+    try:
+        warm()
+    except Exception as e:
+        # Indexes are still built lazily per institution
+        print(f"Autocomplete warm-up failed: {e}")
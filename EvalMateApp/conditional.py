@@ -0,0 +1,95 @@
+"""
+Conditional GET for the dashboard JSON APIs and SPA partials.
+
+``versioned_etag`` builds a strong ETag from the data versions a view's
+output depends on, read in one DataVersion query, plus the URL, the user,
+the CSRF cookie (partials embed a token) and the local date (day-based
+counters). A request whose If-None-Match matches is answered with a 304 before the view
+runs; otherwise the view runs and the ETag is attached. Responses are sent
+as ``private, no-cache`` so browsers keep them but revalidate every time.
+
+Writers keep the versions current: per profile ('student' / 'faculty', see
+``user_changed``), per form ('form') and per institution ('institution').
+"""
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.views.decorators.http import condition
+
+from . import versions
+
+
+def user_changed(profile):
+    """Bump the version of everything shown on a profile's dashboard"""
+    versions.bump(profile.account_type, profile.id)
+
+
+def _profile(request):
+    try:
+        return request.user.profile
+    except Exception:
+        return None
+
+
+def profile_keys(request, *args, **kwargs):
+    """The signed-in profile's own version"""
+    profile = _profile(request)
+    return None if profile is None else [(profile.account_type, profile.id)]
+
+
+def institution_keys(request, *args, **kwargs):
+    """The profile's version and its institution's forms"""
+    profile = _profile(request)
+    if profile is None:
+        return None
+    return [(profile.account_type, profile.id), ('institution', profile.institution)]
+
+
+def form_keys(request, form_id, *args, **kwargs):
+    """The profile's version and one form's version"""
+    profile = _profile(request)
+    return None if profile is None else [(profile.account_type, profile.id), ('form', form_id)]
+
+
+def versioned_etag(version_keys):
+    """Decorator adding a version-based ETag to a view's GET responses.
+
+    ``version_keys(request, *args, **kwargs)`` returns the (scope, key) pairs
+    the response depends on, optionally mixed with extra string parts, or
+    None (or a None part) to serve this request without an ETag.
+    """
+    def decorator(view):
+        def etag_func(request, *args, **kwargs):
+            keys = version_keys(request, *args, **kwargs)
+            if keys is None or any(key is None for key in keys):
+                return None
+            pairs = [key for key in keys if isinstance(key, tuple)]
+            current = versions.get_many(pairs)
+            parts = [
+                f'{view.__module__}.{view.__name__}',
+                request.get_full_path(),
+                str(request.user.pk),
+                request.COOKIES.get(settings.CSRF_COOKIE_NAME, ''),
+                timezone.localdate().isoformat(),
+            ]
+            parts += [f'{scope}:{key}:{version}' for (scope, key), version in sorted(current.items())]
+            parts += [key for key in keys if not isinstance(key, tuple)]
+            return hashlib.md5('|'.join(parts).encode('utf-8')).hexdigest()
+
+        conditional_view = condition(etag_func=etag_func)(view)
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+            response = conditional_view(request, *args, **kwargs)
+            if response.status_code not in (200, 304):
+                # Never let a client revalidate against an error page
+                response.headers.pop('ETag', None)
+            patch_cache_control(response, private=True, no_cache=True, must_revalidate=True, max_age=0)
+            return response
+        return wrapper
+    return decorator
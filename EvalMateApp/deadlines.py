@@ -0,0 +1,64 @@
+"""
+Deadline sweeper.
+
+Forms whose due_at has passed are marked is_closed in batches, using the
+(is_closed, due_at) index, so views can check a stored flag instead of
+parsing and comparing the deadline on every request. Pending evaluations of
+closed forms are kept for PENDING_GRACE (students still see them as expired
+for a while) and then deleted in bulk.
+
+Closing a form or dropping pending rows bumps the 'institution' and
+'student' data versions, so cached search results and pending lists built
+from them are not served again.
+
+Run on a schedule with ``manage.py close_expired_forms``.
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import FormTemplate, PendingEvaluation
+from . import versions
+
+PENDING_GRACE = timedelta(days=7)
+
+
+def close_expired_forms(batch_size=500, now=None):
+    """Mark forms past their deadline as closed; returns how many were closed"""
+    now = now or timezone.now()
+    closed = 0
+    while True:
+        with transaction.atomic():
+            batch = list(FormTemplate.objects.select_for_update(skip_locked=True).filter(
+                is_closed=False, due_at__lte=now,
+            ).order_by('due_at', 'id').values_list('id', 'institution')[:batch_size])
+            if not batch:
+                break
+            form_ids = [form_id for form_id, _ in batch]
+            FormTemplate.objects.filter(id__in=form_ids).update(is_closed=True)
+
+            students = PendingEvaluation.objects.filter(
+                form_id__in=form_ids
+            ).values_list('student_id', flat=True).distinct()
+            versions.bump('institution', *{institution for _, institution in batch if institution})
+            versions.bump('student', *students)
+        closed += len(batch)
+    return closed
+
+
+def prune_pending(batch_size=1000, grace=PENDING_GRACE, now=None):
+    """Delete pending evaluations of forms closed for longer than ``grace``"""
+    cutoff = (now or timezone.now()) - grace
+    removed = 0
+    while True:
+        with transaction.atomic():
+            batch = list(PendingEvaluation.objects.filter(
+                form__is_closed=True, form__due_at__lte=cutoff,
+            ).order_by('id').values_list('id', 'student_id')[:batch_size])
+            if not batch:
+                break
+            PendingEvaluation.objects.filter(id__in=[pending_id for pending_id, _ in batch]).delete()
+            versions.bump('student', *{student_id for _, student_id in batch})
+        removed += len(batch)
+    return removed
@@ -0,0 +1,101 @@
+"""
+Draft store for in-progress peer evaluations.
+
+The evaluation flow used to keep team, teammates and every teammate's answers
+in one session blob, rewritten in full on every step. Drafts live in their own
+tables instead, keyed by (student, form): each step writes one teammate's
+answers row and a small update of the draft header. Drafts expire DRAFT_TTL
+after their last change and are removed by ``manage.py prune_evaluation_drafts``.
+"""
+import uuid
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import EvaluationDraft, EvaluationDraftAnswer
+
+DRAFT_TTL = timedelta(days=7)
+
+
+def _expiry():
+    return timezone.now() + DRAFT_TTL
+
+
+def get_draft(student, form, session=None):
+    """The student's unexpired draft for a form, or None.
+
+    A draft still stored in the session by an older deployment is moved into
+    the draft store when ``session`` is given.
+    """
+    draft = EvaluationDraft.objects.filter(
+        student=student, form=form, expires_at__gt=timezone.now(),
+    ).first()
+    if draft is None and session is not None:
+        draft = _adopt_session(session, student, form)
+    return draft
+
+
+def _adopt_session(session, student, form):
+    legacy = session.pop(f'eval_{form.id}', None)
+    if not legacy:
+        return None
+    draft = start_draft(student, form, legacy.get('team_identifier', ''), legacy.get('teammate_names', []))
+    for evaluation in legacy.get('evaluations', []):
+        save_answers(draft, evaluation.get('teammate'), evaluation.get('answers', {}))
+    set_index(draft, legacy.get('current_index', 0))
+    return draft
+
+
+def start_draft(student, form, team_identifier, teammate_names):
+    """Create or update the team setup of a draft, keeping saved answers"""
+    EvaluationDraft.objects.filter(student=student, form=form, expires_at__lte=timezone.now()).delete()
+    draft, _ = EvaluationDraft.objects.update_or_create(
+        student=student,
+        form=form,
+        defaults={
+            'team_identifier': team_identifier,
+            'teammate_names': teammate_names,
+            'expires_at': _expiry(),
+        },
+    )
+    return draft
+
+
+def save_answers(draft, teammate, answers, next_index=None):
+    """Store one teammate's answers and optionally move the draft to ``next_index``"""
+    with transaction.atomic():
+        EvaluationDraftAnswer.objects.update_or_create(
+            draft=draft, teammate=teammate, defaults={'answers': answers},
+        )
+        if next_index is not None:
+            draft.current_index = next_index
+        draft.expires_at = _expiry()
+        draft.save(update_fields=['current_index', 'expires_at', 'updated_at'])
+
+
+def set_index(draft, index):
+    """Move the draft to another teammate"""
+    draft.current_index = index
+    draft.expires_at = _expiry()
+    draft.save(update_fields=['current_index', 'expires_at', 'updated_at'])
+
+
+def ensure_token(draft):
+    """Idempotency token of the draft's final submission, created on first use"""
+    if not draft.submission_token:
+        draft.submission_token = uuid.uuid4().hex
+        draft.save(update_fields=['submission_token', 'updated_at'])
+    return draft.submission_token
+
+
+def discard(draft):
+    draft.delete()
+
+
+def prune_expired():
+    """Delete expired drafts; returns how many were removed"""
+    expired = EvaluationDraft.objects.filter(expires_at__lte=timezone.now())
+    count = expired.count()
+    expired.delete()
+    return count
@@ -0,0 +1,242 @@
+"""
+Evaluation history for the student dashboard.
+
+A student's history is one row per submitted (form, team): a single grouped
+query returns the form columns, the first response id (used to open the
+details), the latest submission time and the number of teammates evaluated.
+Pages are keyset-paginated on (latest submission, first response id) with
+the cursors from ``pagination``.
+
+The summary the dashboard loads first (total count, queued submissions and
+the first page) is cached per student under the student's data version,
+which every stored or queued submission bumps, and the institution's, which
+form edits and deletions bump.
+
+A submitted evaluation does not change, so its teammate answers are cached
+for DETAIL_TTL under (form, structure hash, student, team) plus that group's
+own 'evaluation' data version, which only a submission for the same form and
+team bumps. A structure edit changes the hash and a resubmission the version,
+so no entry is ever deleted; a deleted form's responses are simply no longer
+found. The form title, course and description are not cached: a repeat view
+reads them, the hash and the group version in one indexed query and then
+makes one cache read.
+"""
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.db.models import CharField, Count, Max, Min, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Cast, Coalesce, Concat, MD5
+
+from .answer_matrix import AnswerMatrix, normalize_question_key
+from .models import DataVersion, FormResponse, QueuedSubmission
+from .pagination import encode_cursor, decode_cursor
+from .schema import get_schema
+from . import versions
+
+PAGE_SIZE = 20
+CACHE_TTL = 10 * 60  # entries are also invalidated by the versions
+DETAIL_TTL = 30 * 24 * 60 * 60
+
+
+def history_groups(student):
+    """One row per submitted (form, team) of a student, latest first"""
+    return FormResponse.objects.filter(submitted_by=student).values(
+        'form_id', 'form__title', 'form__course_id', 'form__description', 'team_identifier',
+    ).annotate(
+        last_submitted_at=Max('submitted_at'),
+        first_id=Min('id'),
+        teammate_count=Count('id'),
+    ).order_by('-last_submitted_at', '-first_id')
+
+
+def _history_item(group):
+    return {
+        'response_id': group['first_id'],
+        'form_id': group['form_id'],
+        'title': group['form__title'],
+        'course': group['form__course_id'],
+        'description': group['form__description'],
+        'submitted_at': group['last_submitted_at'].isoformat(),
+        'team_identifier': group['team_identifier'] or 'N/A',
+        'teammates_evaluated': group['teammate_count'],
+    }
+
+
+def history_page(student, cursor=None, page_size=PAGE_SIZE):
+    """(history items, next cursor or None) of the page after ``cursor``"""
+    groups = history_groups(student)
+    position = decode_cursor(cursor)
+    if position:
+        cursor_at, cursor_id = position
+        groups = groups.filter(
+            Q(last_submitted_at__lt=cursor_at) | Q(last_submitted_at=cursor_at, first_id__lt=cursor_id)
+        )
+
+    page = list(groups[:page_size + 1])
+    next_cursor = None
+    if len(page) > page_size:
+        page = page[:page_size]
+        next_cursor = encode_cursor(page[-1]['last_submitted_at'], page[-1]['first_id'])
+    return [_history_item(group) for group in page], next_cursor
+
+
+def _queued_items(student):
+    # Submissions still waiting in the write queue are shown right away
+    items = []
+    seen = set()
+    queued = QueuedSubmission.objects.filter(submitted_by=student).select_related('form').order_by('-queued_at')
+    for item in queued:
+        key = (item.form_id, item.team_identifier)
+        if key in seen:
+            continue
+        seen.add(key)
+        items.append({
+            'response_id': None,
+            'queued': True,
+            'form_id': item.form_id,
+            'title': item.form.title,
+            'course': item.form.course_id,
+            'description': item.form.description,
+            'submitted_at': item.queued_at.isoformat(),
+            'team_identifier': item.team_identifier or 'N/A',
+            'teammates_evaluated': len(item.entries),
+        })
+    return items, seen
+
+
+def compute_summary(student):
+    """Total, queued items and first page of a student's history"""
+    queued, queued_keys = _queued_items(student)
+    first_page, next_cursor = history_page(student)
+    total = history_groups(student).count()
+
+    # A queued resubmission replaces its stored group rather than adding one
+    shown = {(form_id, team or 'N/A') for form_id, team in queued_keys}
+    first_page = [item for item in first_page if (item['form_id'], item['team_identifier']) not in shown]
+    if queued_keys:
+        condition = Q()
+        for form_id, team in queued_keys:
+            condition |= Q(form_id=form_id, team_identifier=team)
+        total -= history_groups(student).filter(condition).count()
+    return {
+        'total': total + len(queued),
+        'history': queued + first_page,
+        'next_cursor': next_cursor,
+    }
+
+
+def student_summary(student):
+    """Cached ``compute_summary``"""
+    student_version = versions.get_version('student', student.id)
+    institution_version = versions.get_version('institution', student.institution)
+    cache_key = f'evaluation_history:{student.id}:{student_version}:{institution_version}'
+    summary = cache.get(cache_key)
+    if summary is None:
+        summary = compute_summary(student)
+        cache.set(cache_key, summary, CACHE_TTL)
+    return summary
+
+
+def group_version_key(form_id, student_id, team_identifier):
+    """Key of the 'evaluation' data version of a student's submissions for one form and team"""
+    team = hashlib.md5((team_identifier or '').encode('utf-8')).hexdigest()
+    return f'{form_id}:{student_id}:{team}'
+
+
+def _group_key_sql():
+    # group_version_key of a FormResponse, computed by the database
+    return Concat(
+        Cast('form_id', CharField()), Value(':'),
+        Cast('submitted_by_id', CharField()), Value(':'),
+        MD5(Coalesce('team_identifier', Value(''))),
+        output_field=CharField(),
+    )
+
+
+def compute_detail(student, response_id):
+    """Team and answers of every teammate in the submission of ``response_id``, or None"""
+    first_response = FormResponse.objects.filter(
+        id=response_id,
+        submitted_by=student
+    ).select_related('form').first()
+    if not first_response:
+        return None
+
+    # All responses for this form and team identifier
+    all_responses = list(FormResponse.objects.filter(
+        form=first_response.form,
+        submitted_by=student,
+        team_identifier=first_response.team_identifier
+    ).order_by('teammate_name'))
+
+    # Question map from the compiled schema and all answers in one query
+    form = first_response.form
+    question_map = get_schema(form).question_map
+    matrix = AnswerMatrix.for_responses(all_responses)
+
+    teammates_data = []
+    for resp in all_responses:
+        answers_data = []
+        for question_id, answer in matrix.answers_for(resp.id):
+            question_data = question_map.get(normalize_question_key(question_id), {})
+
+            # Get question options if available
+            options_data = question_data.get('options', {})
+            options_list = options_data.get('options', []) if isinstance(options_data, dict) else []
+            labels_list = options_data.get('labels', ['Min', 'Max']) if isinstance(options_data, dict) else ['Min', 'Max']
+            max_value = options_data.get('max', 100) if isinstance(options_data, dict) else 100
+
+            answers_data.append({
+                'question_id': question_id,
+                'question_text': question_data.get('text', 'Question not found'),
+                'question_type': question_data.get('type', 'text'),
+                'answer': answer,
+                'options': options_list,
+                'labels': labels_list,
+                'max': max_value
+            })
+
+        teammates_data.append({
+            'teammate_name': resp.teammate_name or 'Unknown',
+            'submitted_at': resp.submitted_at.isoformat(),
+            'answers': answers_data
+        })
+
+    return {
+        'team_identifier': first_response.team_identifier or 'N/A',
+        'teammates': teammates_data,
+        'total_teammates': len(teammates_data)
+    }
+
+
+def evaluation_detail(student, response_id):
+    """Form fields plus the cached ``compute_detail``, or None if the response is not the student's"""
+    group_version = DataVersion.objects.filter(scope='evaluation', key=OuterRef('group_key')).values('version')[:1]
+    row = FormResponse.objects.filter(id=response_id, submitted_by=student).annotate(
+        group_key=_group_key_sql(),
+    ).annotate(group_version=Subquery(group_version)).values(
+        'form_id', 'form__structure_hash', 'form__title', 'form__course_id', 'form__description',
+        'team_identifier', 'group_version',
+    ).first()
+    if row is None:
+        return None
+
+    # json.dumps keeps a missing team apart from an empty one
+    team = hashlib.md5(json.dumps(row['team_identifier']).encode('utf-8')).hexdigest()
+    cache_key = (
+        f"evaluation_detail:{row['form_id']}:{row['form__structure_hash']}:{student.id}:{team}:"
+        f"{row['group_version'] or 0}"
+    )
+    payload = cache.get(cache_key)
+    if payload is None:
+        payload = compute_detail(student, response_id)
+        if payload is None:
+            return None
+        cache.set(cache_key, payload, DETAIL_TTL)
+    return {
+        'form_title': row['form__title'],
+        'course': row['form__course_id'],
+        'description': row['form__description'],
+        **payload,
+    }
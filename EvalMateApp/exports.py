@@ -0,0 +1,94 @@
+"""
+Streaming CSV / JSON Lines export of a form's responses.
+
+Rows come from the form's persisted wide answer matrix (one row per response,
+submitter x teammate), read a few chunks at a time and written out
+immediately, so memory use does not grow with the size of the form.
+"""
+import csv
+import json
+
+from .models import Profile
+from .answer_matrix import normalize_question_key, question_index
+from . import form_matrix
+
+BASE_COLUMNS = ['Response ID', 'Submitted At', 'Student', 'Username', 'Team', 'Teammate']
+
+
+class Echo:
+    """File-like object whose write() hands the line back to csv.writer"""
+
+    def write(self, value):
+        return value
+
+
+def export_questions(form):
+    """(normalized question id, question text) pairs in form order"""
+    questions, _ = question_index(form.structure)
+    return [(normalize_question_key(q.get('id')), q.get('text', 'Question')) for q in questions]
+
+
+def _format_answer(value):
+    # Scores are stored as floats in the matrix; print 4.0 as 4
+    if isinstance(value, float):
+        return f'{value:g}'
+    return value
+
+
+def iter_responses(form, anonymous=False):
+    """Yield (metadata dict, {normalized question id: answer}) per response"""
+    matrix = form_matrix.load_matrix(form)
+    offset = len(form_matrix.META_COLUMNS)
+
+    for rows in form_matrix.iter_chunks(matrix):
+        profiles = {}
+        if not anonymous:
+            profiles = Profile.objects.select_related('user').in_bulk({row[2] for row in rows})
+
+        for row in rows:
+            response_id, submitted_at, submitted_by_id, team, teammate = row[:offset]
+            answers = {
+                question_id: _format_answer(value)
+                for question_id, value in zip(matrix.columns, row[offset:])
+                if value is not None
+            }
+            profile = profiles.get(submitted_by_id)
+            if anonymous:
+                student, username = 'Anonymous', ''
+            elif profile is None:
+                student, username = '', ''
+            else:
+                student = f'{profile.first_name or ""} {profile.last_name or ""}'.strip()
+                username = profile.user.username
+            yield {
+                'response_id': response_id,
+                'submitted_at': submitted_at,
+                'student': student,
+                'username': username or '',
+                'team': team or '',
+                'teammate': teammate or '',
+            }, answers
+
+
+def stream_csv(form, anonymous=False):
+    questions = export_questions(form)
+    writer = csv.writer(Echo())
+
+    yield '\ufeff'  # BOM so spreadsheet apps detect UTF-8
+    yield writer.writerow(BASE_COLUMNS + [text for _, text in questions])
+    for meta, answers in iter_responses(form, anonymous):
+        yield writer.writerow(
+            [meta['response_id'], meta['submitted_at'], meta['student'], meta['username'],
+             meta['team'], meta['teammate']]
+            + [answers.get(question_id, '') for question_id, _ in questions]
+        )
+
+
+def stream_jsonl(form, anonymous=False):
+    questions = export_questions(form)
+    for meta, answers in iter_responses(form, anonymous):
+        meta['answers'] = [
+            {'question_id': question_id, 'question': text, 'answer': answers.get(question_id)}
+            for question_id, text in questions
+        ]
+        yield json.dumps(meta, ensure_ascii=False) + '\n'
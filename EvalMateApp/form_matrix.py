@@ -0,0 +1,169 @@
+"""
+Persisted wide-format answer matrix per form.
+
+FormAnswerMatrix keeps one row per response and one column per question,
+split into fixed-size chunks. The submit path appends new rows inside its
+transaction; form-wide exports stream the chunks instead of
+re-joining FormResponse -> ResponseAnswer.
+
+The matrix records the form data version it reflects. Submissions and
+structure edits bump that version, and a submit only appends to a matrix that
+reflects the version right before its own bump. A matrix that missed an
+append or a structure edit (including a question changing type under the same
+id) is rebuilt on the next read (or with ``manage.py rebuild_answer_matrix``).
+"""
+import itertools
+import math
+
+from django.db import transaction
+
+from .models import FormResponse, FormAnswerMatrix, FormAnswerMatrixChunk
+from .answer_matrix import NUMERIC_TYPES, normalize_question_key, question_index
+from . import versions
+
+# Small, so an append rewrites at most this many rows of the last chunk
+CHUNK_ROWS = 50
+# Leading metadata cells of every row, before the per-question answers
+META_COLUMNS = ('response_id', 'submitted_at', 'submitted_by_id', 'team_identifier', 'teammate_name')
+
+
+def matrix_columns(structure):
+    """(normalized question ids, question types) in form order"""
+    questions, _ = question_index(structure)
+    return (
+        [normalize_question_key(q.get('id')) for q in questions],
+        [q.get('type') for q in questions],
+    )
+
+
+def _cell(value, question_type):
+    # Scores are stored as numbers so readers can load them straight into arrays
+    if value is not None and question_type in NUMERIC_TYPES:
+        try:
+            number = float(value)
+            if math.isfinite(number):
+                return number
+        except (TypeError, ValueError):
+            pass
+    return value
+
+
+def build_row(response, answers, columns, types):
+    """Matrix row for a FormResponse and its {question key: answer} dict"""
+    normalized = {normalize_question_key(k): v for k, v in answers.items()}
+    return [
+        response.id,
+        response.submitted_at.isoformat(),
+        response.submitted_by_id,
+        response.team_identifier,
+        response.teammate_name,
+    ] + [_cell(normalized.get(column), types[i]) for i, column in enumerate(columns)]
+
+
+def _write_rows(matrix, rows, last_chunk=None):
+    """Append rows to the matrix chunks, starting a new chunk when one is full.
+
+    Returns the chunk that received the last row.
+    """
+    touched = []
+    chunk = last_chunk
+    for row in rows:
+        if chunk is None or chunk.row_count >= CHUNK_ROWS:
+            chunk = FormAnswerMatrixChunk(matrix=matrix, index=chunk.index + 1 if chunk else 0)
+            touched.append(chunk)
+        elif chunk not in touched:
+            touched.append(chunk)
+        chunk.rows.append(row)
+        chunk.row_count += 1
+
+    for chunk in touched:
+        chunk.save()
+    return chunk
+
+
+def append_responses(form, entries):
+    """Append (FormResponse, answers dict) pairs to the form's matrix.
+
+    Call inside the submit transaction, after the form version was bumped.
+    Missing or stale matrices are left alone; the next read rebuilds them.
+    """
+    columns, types = matrix_columns(form.structure)
+    matrix = FormAnswerMatrix.objects.select_for_update().filter(form=form).first()
+    current_version = versions.get_version('form', form.id)
+    # Only this submit's bump may be missing; anything else (an edit, a missed append) makes it stale
+    if matrix is None or matrix.columns != columns or matrix.source_version != current_version - 1:
+        return False
+
+    last_chunk = matrix.chunks.order_by('-index').first()
+    _write_rows(matrix, [build_row(r, answers, columns, types) for r, answers in entries], last_chunk)
+
+    matrix.row_count += len(entries)
+    matrix.source_version = current_version
+    matrix.save(update_fields=['row_count', 'source_version', 'updated_at'])
+    return True
+
+
+def rebuild_matrix(form):
+    """Rebuild a form's matrix from the FormResponse/ResponseAnswer tables"""
+    columns, types = matrix_columns(form.structure)
+
+    with transaction.atomic():
+        matrix, _ = FormAnswerMatrix.objects.select_for_update().get_or_create(form=form)
+        # Read the version first: anything submitted after this bumps it again
+        source_version = versions.get_version('form', form.id)
+        matrix.chunks.all().delete()
+
+        rows = FormResponse.objects.filter(form=form).order_by('id').values_list(
+            'id', 'submitted_at', 'submitted_by_id', 'team_identifier', 'teammate_name',
+            'answers__question', 'answers__answer', 'answers_doc',
+        ).iterator(chunk_size=2000)
+
+        row_count = 0
+        buffer = []
+        last_chunk = None
+        for response_id, group in itertools.groupby(rows, key=lambda row: row[0]):
+            answers = {}
+            first = None
+            for row in group:
+                first = first or row
+                if row[7] is None and row[5] is not None:
+                    answers[normalize_question_key(row[5])] = row[6]
+            for question, answer in first[7] or []:
+                answers[normalize_question_key(question)] = answer
+            _, submitted_at, submitted_by_id, team, teammate = first[:5]
+            buffer.append(
+                [response_id, submitted_at.isoformat(), submitted_by_id, team, teammate]
+                + [_cell(answers.get(column), types[i]) for i, column in enumerate(columns)]
+            )
+            row_count += 1
+            if len(buffer) >= CHUNK_ROWS:
+                last_chunk = _write_rows(matrix, buffer, last_chunk)
+                buffer = []
+        if buffer:
+            _write_rows(matrix, buffer, last_chunk)
+
+        matrix.columns = columns
+        matrix.row_count = row_count
+        matrix.source_version = source_version
+        matrix.save()
+    return matrix
+
+
+def load_matrix(form):
+    """The form's up-to-date matrix header, rebuilding it if missing or stale"""
+    columns, _ = matrix_columns(form.structure)
+    matrix = FormAnswerMatrix.objects.filter(form=form).first()
+    if (
+        matrix is None
+        or matrix.columns != columns
+        or matrix.source_version != versions.get_version('form', form.id)
+    ):
+        matrix = rebuild_matrix(form)
+    return matrix
+
+
+def iter_chunks(matrix):
+    """Yield each chunk's list of rows, a few hundred rows in memory at a time"""
+    chunks = FormAnswerMatrixChunk.objects.filter(matrix=matrix).order_by('index')
+    for rows in chunks.values_list('rows', flat=True).iterator(chunk_size=10):
+        yield rows
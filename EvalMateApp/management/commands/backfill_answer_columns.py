@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from EvalMateApp.models import FormTemplate, ResponseAnswer
+from EvalMateApp.answer_matrix import question_index, typed_answer
+
+
+class Command(BaseCommand):
+    help = 'Fills ResponseAnswer.question_id / numeric_value for rows written before those columns existed'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Rows updated per transaction')
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        question_maps = {}
+        last_id = 0
+        updated = 0
+
+        while True:
+            rows = list(ResponseAnswer.objects.filter(
+                id__gt=last_id, question_id__isnull=True,
+            ).order_by('id').values_list('id', 'response_id', 'response__form_id', 'question', 'answer')[:chunk_size])
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            missing = {row[2] for row in rows} - question_maps.keys()
+            for form_id, structure in FormTemplate.objects.filter(id__in=missing).values_list('id', 'structure'):
+                question_maps[form_id] = question_index(structure)[1]
+
+            # (response, question_id) pairs already taken, so duplicates stay NULL
+            response_ids = {row[1] for row in rows}
+            taken = set(ResponseAnswer.objects.filter(
+                response_id__in=response_ids, question_id__isnull=False,
+            ).values_list('response_id', 'question_id'))
+
+            changed = []
+            for answer_id, response_id, form_id, question, answer in rows:
+                question_id, numeric_value = typed_answer(question, answer, question_maps.get(form_id, {}))
+                if question_id is None or (response_id, question_id) in taken:
+                    continue
+                taken.add((response_id, question_id))
+                changed.append(ResponseAnswer(id=answer_id, question_id=question_id, numeric_value=numeric_value))
+
+            with transaction.atomic():
+                ResponseAnswer.objects.bulk_update(changed, ['question_id', 'numeric_value'])
+            updated += len(changed)
+            self.stdout.write(f'  Up to answer {last_id}: {updated} rows typed')
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Backfilled typed columns for {updated} answer(s)'))
@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from EvalMateApp.models import FormResponse, ResponseAnswer
+
+
+class Command(BaseCommand):
+    help = 'Copies ResponseAnswer rows into FormResponse.answers_doc for document storage mode'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500, help='Responses converted per transaction')
+        parser.add_argument(
+            '--prune-rows', action='store_true',
+            help='Delete converted rows already typed as non-scores (run backfill_answer_columns first)',
+        )
+        parser.add_argument(
+            '--force', action='store_true',
+            help='Convert even though ANSWER_STORAGE_MODE is not "document"',
+        )
+
+    def handle(self, *args, **options):
+        # Converted responses are read from their document from then on
+        if settings.ANSWER_STORAGE_MODE != 'document' and not options['force']:
+            raise CommandError(
+                f'ANSWER_STORAGE_MODE is "{settings.ANSWER_STORAGE_MODE}"; set it to "document" '
+                'before converting, or pass --force'
+            )
+
+        chunk_size = options['chunk_size']
+        last_id = 0
+        converted = 0
+        pruned = 0
+
+        while True:
+            response_ids = list(FormResponse.objects.filter(
+                id__gt=last_id, answers_doc__isnull=True,
+            ).order_by('id').values_list('id', flat=True)[:chunk_size])
+            if not response_ids:
+                break
+            last_id = response_ids[-1]
+
+            documents = {response_id: [] for response_id in response_ids}
+            rows = ResponseAnswer.objects.filter(
+                response_id__in=response_ids
+            ).order_by('id').values_list('response_id', 'question', 'answer')
+            for response_id, question, answer in rows:
+                documents[response_id].append([question, answer])
+
+            with transaction.atomic():
+                FormResponse.objects.bulk_update(
+                    [FormResponse(id=response_id, answers_doc=document) for response_id, document in documents.items()],
+                    ['answers_doc'],
+                )
+                if options['prune_rows']:
+                    pruned += ResponseAnswer.objects.filter(
+                        response_id__in=response_ids,
+                        question_id__isnull=False,
+                        numeric_value__isnull=True,
+                    ).delete()[0]
+            converted += len(response_ids)
+            self.stdout.write(f'  Up to response {last_id}: {converted} converted')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'✅ Stored answer documents for {converted} response(s), pruned {pruned} row(s)'
+        ))
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from EvalMateApp.models import FormTemplate, parse_due_date
+
+
+class Command(BaseCommand):
+    help = 'Fills FormTemplate.due_at from the dueDate/dueTime settings of each form structure'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500, help='Forms updated per transaction')
+
+    def handle(self, *args, **options):
+        chunk_size = options['chunk_size']
+        last_id = 0
+        updated = 0
+
+        while True:
+            rows = list(FormTemplate.objects.filter(id__gt=last_id).order_by('id').values_list(
+                'id', 'structure', 'due_at',
+            )[:chunk_size])
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            changed = []
+            for form_id, structure, due_at in rows:
+                parsed = parse_due_date(structure, form_id)
+                if parsed != due_at:
+                    changed.append(FormTemplate(id=form_id, due_at=parsed))
+
+            with transaction.atomic():
+                FormTemplate.objects.bulk_update(changed, ['due_at'])
+            updated += len(changed)
+            self.stdout.write(f'  Up to form {last_id}: {updated} deadlines updated')
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Backfilled due_at for {updated} form(s)'))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from EvalMateApp import activity
+from EvalMateApp.models import Profile
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the recent-activity feed of every faculty member from their stored responses'
+
+    def handle(self, *args, **options):
+        written = 0
+        faculty = Profile.objects.filter(account_type='faculty').order_by('id')
+        for profile in faculty.iterator():
+            with transaction.atomic():
+                written += activity.backfill(profile)
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Wrote {written} activity row(s) for {faculty.count()} faculty member(s)'))
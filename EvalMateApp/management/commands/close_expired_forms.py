@@ -0,0 +1,18 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from EvalMateApp.deadlines import PENDING_GRACE, close_expired_forms, prune_pending
+
+
+class Command(BaseCommand):
+    help = 'Closes forms past their deadline and deletes their stale pending evaluations (run on a schedule)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='Forms closed per transaction')
+        parser.add_argument('--keep-days', type=int, default=PENDING_GRACE.days,
+                            help='Days pending evaluations of a closed form are kept')
+
+    def handle(self, *args, **options):
+        closed = close_expired_forms(options['batch_size'])
+        removed = prune_pending(grace=timedelta(days=options['keep_days']))
+        self.stdout.write(self.style.SUCCESS(f'✅ Closed {closed} expired form(s), removed {removed} pending evaluation(s)'))
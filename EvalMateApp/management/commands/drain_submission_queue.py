@@ -0,0 +1,28 @@
+import time
+
+from django.core.management.base import BaseCommand
+from EvalMateApp.submissions import drain_queue
+
+
+class Command(BaseCommand):
+    help = 'Stores queued evaluation submissions in batched transactions, retrying failures'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50, help='Submissions stored per transaction')
+        parser.add_argument('--loop', action='store_true', help='Keep polling the queue instead of exiting when empty')
+        parser.add_argument('--sleep', type=float, default=2.0, help='Seconds to wait between polls with --loop')
+
+    def handle(self, *args, **options):
+        total_stored = total_failed = 0
+        while True:
+            stored, failed = drain_queue(options['batch_size'])
+            total_stored += stored
+            total_failed += failed
+            if stored or failed:
+                self.stdout.write(f'  Batch: {stored} stored, {failed} failed')
+            elif options['loop']:
+                time.sleep(options['sleep'])
+            else:
+                break
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Stored {total_stored} queued submission(s), {total_failed} failed attempt(s)'))
@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+from EvalMateApp.drafts import prune_expired
+
+
+class Command(BaseCommand):
+    help = 'Deletes in-progress evaluation drafts that passed their expiry time'
+
+    def handle(self, *args, **options):
+        removed = prune_expired()
+        self.stdout.write(self.style.SUCCESS(f'✅ Removed {removed} expired evaluation draft(s)'))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from EvalMateApp.models import FormTemplate
+from EvalMateApp.form_matrix import rebuild_matrix
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the persisted wide answer matrix used by exports and analytics'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--form', type=int, help='Only rebuild the matrix of this form id')
+
+    def handle(self, *args, **options):
+        forms = FormTemplate.objects.only('id', 'structure').order_by('id')
+        if options.get('form'):
+            forms = forms.filter(id=options['form'])
+
+        rebuilt = 0
+        for form in forms.iterator(chunk_size=200):
+            matrix = rebuild_matrix(form)
+            rebuilt += 1
+            self.stdout.write(f'  Form {form.id}: {matrix.row_count} rows, {len(matrix.columns)} questions')
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Rebuilt answer matrices for {rebuilt} form(s)'))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from EvalMateApp.models import FormTemplate
+from EvalMateApp.stats import rebuild_form_stats
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the per-form submission rollups used by the reports pages'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--form', type=int, help='Only rebuild the rollups of this form id')
+
+    def handle(self, *args, **options):
+        forms = FormTemplate.objects.only('id').order_by('id')
+        if options.get('form'):
+            forms = forms.filter(id=options['form'])
+
+        rebuilt = 0
+        for form in forms.iterator(chunk_size=200):
+            groups, unread = rebuild_form_stats(form)
+            rebuilt += 1
+            self.stdout.write(f'  Form {form.id}: {groups} submissions, {unread} unread')
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Rebuilt submission stats for {rebuilt} form(s)'))
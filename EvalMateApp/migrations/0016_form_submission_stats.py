@@ -0,0 +1,37 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:41
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EvalMateApp', '0015_merge_20251202_2127'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FormSubmissionStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_submissions', models.PositiveIntegerField(default=0)),
+                ('unread_responses', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('form', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='stats', to='EvalMateApp.formtemplate')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FormDailySubmissions',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('submissions', models.PositiveIntegerField(default=0)),
+                ('form', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_submissions', to='EvalMateApp.formtemplate')),
+            ],
+            options={
+                'ordering': ['-day'],
+                'unique_together': {('form', 'day')},
+            },
+        ),
+    ]
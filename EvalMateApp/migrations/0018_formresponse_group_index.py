@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EvalMateApp', '0017_data_version'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='formresponse',
+            index=models.Index(fields=['form', 'submitted_by', 'team_identifier'], name='EvalMateApp_form_id_0323db_idx'),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:49
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EvalMateApp', '0018_formresponse_group_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FormAnswerMatrix',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('columns', models.JSONField(default=list)),
+                ('row_count', models.PositiveIntegerField(default=0)),
+                ('source_version', models.PositiveBigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('form', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='answer_matrix', to='EvalMateApp.formtemplate')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='FormAnswerMatrixChunk',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('index', models.PositiveIntegerField()),
+                ('rows', models.JSONField(default=list)),
+                ('row_count', models.PositiveIntegerField(default=0)),
+                ('matrix', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='EvalMateApp.formanswermatrix')),
+            ],
+            options={
+                'ordering': ['index'],
+                'unique_together': {('matrix', 'index')},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:51
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EvalMateApp', '0019_form_answer_matrix'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='formresponse',
+            index=models.Index(django.db.models.functions.text.Upper('teammate_name'), models.F('form'), name='formresponse_teammate_upper'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EvalMateApp', '0020_formresponse_teammate_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SubmissionReceipt',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('token', models.CharField(max_length=64)),
+                ('response_ids', models.JSONField(default=list)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('form', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='submission_receipts', to='EvalMateApp.formtemplate')),
+                ('submitted_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='submission_receipts', to='EvalMateApp.profile')),
+            ],
+            options={
+                'unique_together': {('submitted_by', 'token')},
+            },
+        ),
+    ]
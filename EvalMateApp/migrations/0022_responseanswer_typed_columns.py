@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EvalMateApp', '0021_submission_receipt'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='responseanswer',
+            name='numeric_value',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='responseanswer',
+            name='question_id',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='responseanswer',
+            index=models.Index(fields=['question_id', 'numeric_value'], name='EvalMateApp_questio_14476a_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='responseanswer',
+            constraint=models.UniqueConstraint(fields=('response', 'question_id'), name='responseanswer_unique_question'),
+        ),
+    ]
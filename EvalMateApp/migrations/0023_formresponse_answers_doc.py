@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EvalMateApp', '0022_responseanswer_typed_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='formresponse',
+            name='answers_doc',
+            field=models.JSONField(blank=True, null=True),
+        ),
+    ]
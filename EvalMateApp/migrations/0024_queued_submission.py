@@ -0,0 +1,35 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:56
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EvalMateApp', '0023_formresponse_answers_doc'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QueuedSubmission',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('team_identifier', models.CharField(blank=True, max_length=255, null=True)),
+                ('token', models.CharField(max_length=64)),
+                ('entries', models.JSONField(default=list)),
+                ('queued_at', models.DateTimeField(auto_now_add=True)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('last_error', models.TextField(blank=True)),
+                ('failed', models.BooleanField(default=False)),
+                ('form', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='queued_submissions', to='EvalMateApp.formtemplate')),
+                ('submitted_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='queued_submissions', to='EvalMateApp.profile')),
+            ],
+            options={
+                'ordering': ['id'],
+                'unique_together': {('submitted_by', 'token')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EvalMateApp', '0024_queued_submission'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='formtemplate',
+            name='compiled_schema',
+            field=models.JSONField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='formtemplate',
+            name='structure_hash',
+            field=models.CharField(blank=True, max_length=40),
+        ),
+    ]
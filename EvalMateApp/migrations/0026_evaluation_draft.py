@@ -0,0 +1,44 @@
+# Generated by Django 5.2.6 on 2026-10-18 03:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EvalMateApp', '0025_formtemplate_compiled_schema'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EvaluationDraft',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('team_identifier', models.CharField(max_length=255)),
+                ('teammate_names', models.JSONField(default=list)),
+                ('current_index', models.PositiveIntegerField(default=0)),
+                ('submission_token', models.CharField(blank=True, max_length=64)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+                ('form', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='evaluation_drafts', to='EvalMateApp.formtemplate')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='evaluation_drafts', to='EvalMateApp.profile')),
+            ],
+            options={
+                'unique_together': {('student', 'form')},
+            },
+        ),
+        migrations.CreateModel(
+            name='EvaluationDraftAnswer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('teammate', models.CharField(max_length=255)),
+                ('answers', models.JSONField(default=dict)),
+                ('saved_at', models.DateTimeField(auto_now=True)),
+                ('draft', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='answers', to='EvalMateApp.evaluationdraft')),
+            ],
+            options={
+                'unique_together': {('draft', 'teammate')},
+            },
+        ),
+    ]
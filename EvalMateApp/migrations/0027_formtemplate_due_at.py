@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-18 04:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EvalMateApp', '0026_evaluation_draft'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='formtemplate',
+            name='due_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
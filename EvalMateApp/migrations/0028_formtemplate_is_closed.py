@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-18 04:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EvalMateApp', '0027_formtemplate_due_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='formtemplate',
+            name='is_closed',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='formtemplate',
+            index=models.Index(fields=['is_closed', 'due_at'], name='EvalMateApp_is_clos_0955f6_idx'),
+        ),
+    ]
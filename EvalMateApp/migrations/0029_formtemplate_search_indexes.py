@@ -0,0 +1,42 @@
+from django.db import migrations
+
+# Must match search.DOCUMENT_SQL
+DOCUMENT_SQL = "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(course_id, ''))"
+
+
+def create_search_indexes(apps, schema_editor):
+    # Full-text and trigram indexes for form search; other databases use LIKE
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    table = apps.get_model('EvalMateApp', 'FormTemplate')._meta.db_table
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS formtemplate_search_document_gin '
+        f'ON "{table}" USING gin (({DOCUMENT_SQL}))'
+    )
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS formtemplate_title_trgm '
+        f'ON "{table}" USING gin (title gin_trgm_ops)'
+    )
+    schema_editor.execute(
+        f'CREATE INDEX IF NOT EXISTS formtemplate_course_id_trgm '
+        f'ON "{table}" USING gin (course_id gin_trgm_ops)'
+    )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in ('formtemplate_search_document_gin', 'formtemplate_title_trgm', 'formtemplate_course_id_trgm'):
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EvalMateApp', '0028_formtemplate_is_closed'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
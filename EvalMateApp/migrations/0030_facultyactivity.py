@@ -0,0 +1,32 @@
+# Generated by Django 5.2.6 on 2026-10-18 04:16
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('EvalMateApp', '0029_formtemplate_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FacultyActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('team_identifier', models.CharField(blank=True, max_length=255, null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('faculty', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='activity', to='EvalMateApp.profile')),
+                ('form', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='EvalMateApp.formtemplate')),
+                ('response', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='EvalMateApp.formresponse')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='EvalMateApp.profile')),
+            ],
+            options={
+                'verbose_name_plural': 'faculty activity',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['faculty', '-created_at'], name='EvalMateApp_faculty_29b1df_idx')],
+            },
+        ),
+    ]
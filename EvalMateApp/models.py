@@ -1,5 +1,7 @@
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
+from django.db.models.functions import Upper
 
 class Profile(models.Model):
     user = models.OneToOneField(User, on_delete=models.CASCADE)
@@ -30,6 +32,45 @@ class Profile(models.Model):
         return f'{self.user.username} Profile'
 
 
+def parse_due_date(structure, form_id=None):
+    """Extract due date and time from form structure settings"""
+    if structure and 'settings' in structure:
+        due_date_str = structure['settings'].get('dueDate')
+        due_time_str = structure['settings'].get('dueTime')
+
+        if due_date_str:
+            try:
+                from datetime import datetime
+                from django.utils import timezone
+
+                # Clean up the date string - remove any 'Z' or timezone info
+                due_date_clean = due_date_str.replace('Z', '').replace('+00:00', '').split('T')[0]
+
+                # Combine date and time if both exist
+                if due_time_str and due_time_str.strip():
+                    # Parse the date (YYYY-MM-DD format)
+                    # Parse the time (HH:MM format in 24-hour)
+                    datetime_str = f"{due_date_clean}T{due_time_str}:00"
+                    dt = datetime.fromisoformat(datetime_str)
+                else:
+                    # If no time specified, try to parse as full ISO format first
+                    if 'T' in due_date_str:
+                        dt = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
+                    else:
+                        # Just a date, default to midnight
+                        datetime_str = f"{due_date_clean}T00:00:00"
+                        dt = datetime.fromisoformat(datetime_str)
+
+                # Ensure timezone aware
+                if dt.tzinfo is None:
+                    dt = timezone.make_aware(dt)
+                return dt
+            except Exception as e:
+                print(f"Error parsing due_date for form {form_id}: date='{due_date_str}', time='{due_time_str}', error={e}")
+                return None
+    return None
+
+
 class FormTemplate(models.Model):
     PRIVACY_CHOICES = [
         ('private', 'Draft (Not Published)'),
@@ -46,6 +87,13 @@ class FormTemplate(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     privacy = models.CharField(max_length=30, choices=PRIVACY_CHOICES, default='private')
     passcode = models.CharField(max_length=50, blank=True, null=True)
+    # Compiled question index, limits and settings (see schema.py), refreshed on publish
+    compiled_schema = models.JSONField(null=True, blank=True)
+    structure_hash = models.CharField(max_length=40, blank=True)
+    # Deadline parsed from structure settings at publish time, so it can be filtered/sorted in SQL
+    due_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    # Set by manage.py close_expired_forms once the deadline has passed
+    is_closed = models.BooleanField(default=False)
     
     @property
     def is_published(self):
@@ -56,6 +104,7 @@ class FormTemplate(models.Model):
         indexes = [
             models.Index(fields=['institution', 'privacy']),
             models.Index(fields=['created_by', '-created_at']),
+            models.Index(fields=['is_closed', 'due_at']),
         ]
         ordering = ['-created_at']
 
@@ -64,42 +113,20 @@ class FormTemplate(models.Model):
     
     @property
     def due_date(self):
-        """Extract due date and time from structure settings"""
-        if self.structure and 'settings' in self.structure:
-            due_date_str = self.structure['settings'].get('dueDate')
-            due_time_str = self.structure['settings'].get('dueTime')
-            
-            if due_date_str:
-                try:
-                    from datetime import datetime
-                    from django.utils import timezone
-                    
-                    # Clean up the date string - remove any 'Z' or timezone info
-                    due_date_clean = due_date_str.replace('Z', '').replace('+00:00', '').split('T')[0]
-                    
-                    # Combine date and time if both exist
-                    if due_time_str and due_time_str.strip():
-                        # Parse the date (YYYY-MM-DD format)
-                        # Parse the time (HH:MM format in 24-hour)
-                        datetime_str = f"{due_date_clean}T{due_time_str}:00"
-                        dt = datetime.fromisoformat(datetime_str)
-                    else:
-                        # If no time specified, try to parse as full ISO format first
-                        if 'T' in due_date_str:
-                            dt = datetime.fromisoformat(due_date_str.replace('Z', '+00:00'))
-                        else:
-                            # Just a date, default to midnight
-                            datetime_str = f"{due_date_clean}T00:00:00"
-                            dt = datetime.fromisoformat(datetime_str)
-                    
-                    # Ensure timezone aware
-                    if dt.tzinfo is None:
-                        dt = timezone.make_aware(dt)
-                    return dt
-                except Exception as e:
-                    print(f"Error parsing due_date for form {self.id}: date='{due_date_str}', time='{due_time_str}', error={e}")
-                    return None
-        return None
+        """Deadline, read from the indexed due_at column"""
+        if self.due_at is None and 'structure' not in self.get_deferred_fields():
+            # Rows saved before due_at existed (see manage.py backfill_due_dates)
+            return parse_due_date(self.structure, self.id)
+        # The database returns UTC; callers format the deadline in local time
+        return timezone.localtime(self.due_at) if self.due_at else None
+    
+    @property
+    def is_past_due(self):
+        """True once the form was closed by the sweeper or its deadline has passed"""
+        if self.is_closed:
+            return True
+        due_date = self.due_date
+        return due_date is not None and timezone.now() > due_date
     
     @property
     def team_name(self):
@@ -119,12 +146,18 @@ class FormResponse(models.Model):
     # New fields for team-based peer evaluation
     team_identifier = models.CharField(max_length=255, blank=True, null=True, db_index=True)
     teammate_name = models.CharField(max_length=255, blank=True, null=True)
+    # Document storage mode: [[question key, answer], ...] in saved order.
+    # NULL means the answers live in ResponseAnswer rows.
+    answers_doc = models.JSONField(null=True, blank=True)
 
     class Meta:
         indexes = [
             models.Index(fields=['form', '-submitted_at']),
             models.Index(fields=['is_read', 'form']),
             models.Index(fields=['team_identifier']),
+            models.Index(fields=['form', 'submitted_by', 'team_identifier']),
+            # Case-insensitive teammate lookups for cross-form student analytics
+            models.Index(Upper('teammate_name'), 'form', name='formresponse_teammate_upper'),
         ]
         ordering = ['-submitted_at']
 
@@ -139,11 +172,71 @@ class ResponseAnswer(models.Model):
     response = models.ForeignKey(FormResponse, on_delete=models.CASCADE, related_name='answers')
     question = models.TextField()
     answer = models.TextField(blank=True)
+    # Typed copies filled at write time: the form builder's numeric question id
+    # (both 'question_<id>' and '<id>' keys) and the score of rating/slider answers
+    question_id = models.BigIntegerField(null=True, blank=True)
+    numeric_value = models.FloatField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['response', 'question_id'], name='responseanswer_unique_question'),
+        ]
+        indexes = [
+            models.Index(fields=['question_id', 'numeric_value']),
+        ]
 
     def __str__(self):
         return f'Answer to "{self.question[:40]}"'
 
 
+class FormSubmissionStats(models.Model):
+    """Maintained rollup of submission counts for a form (read by the reports pages)"""
+    form = models.OneToOneField(FormTemplate, on_delete=models.CASCADE, related_name='stats')
+    # Unique (submitted_by, team_identifier) groups, i.e. one per student submission
+    total_submissions = models.PositiveIntegerField(default=0)
+    # Individual teammate responses that faculty have not opened yet
+    unread_responses = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'Stats for {self.form_id}: {self.total_submissions} submissions, {self.unread_responses} unread'
+
+
+class FormDailySubmissions(models.Model):
+    """Per-day bucket of unique submissions for a form"""
+    form = models.ForeignKey(FormTemplate, on_delete=models.CASCADE, related_name='daily_submissions')
+    day = models.DateField()
+    submissions = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ['form', 'day']
+        ordering = ['-day']
+
+    def __str__(self):
+        return f'{self.form_id} on {self.day}: {self.submissions}'
+
+
+class FacultyActivity(models.Model):
+    """Append-only feed of submissions to a faculty member's forms (read by the overview)"""
+    faculty = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='activity')
+    form = models.ForeignKey(FormTemplate, on_delete=models.CASCADE, related_name='+')
+    student = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='+')
+    # First response of the submission, opened by "View Details"
+    response = models.ForeignKey(FormResponse, on_delete=models.CASCADE, related_name='+')
+    team_identifier = models.CharField(max_length=255, blank=True, null=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['faculty', '-created_at']),
+        ]
+        ordering = ['-created_at']
+        verbose_name_plural = 'faculty activity'
+
+    def __str__(self):
+        return f'{self.student_id} submitted {self.form_id} at {self.created_at}'
+
+
 class PendingEvaluation(models.Model):
     """Tracks forms that students have accessed but not yet completed"""
     student = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='pending_evaluations')
@@ -184,3 +277,124 @@ class PendingEvaluation(models.Model):
         else:
             return 'not_started'
 
+
+
+class DataVersion(models.Model):
+    """Monotonic version counters used to key cached data (e.g. per form)"""
+    scope = models.CharField(max_length=30)
+    key = models.CharField(max_length=255)
+    version = models.PositiveBigIntegerField(default=1)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['scope', 'key']
+
+    def __str__(self):
+        return f'{self.scope}:{self.key} v{self.version}'
+
+
+class FormAnswerMatrix(models.Model):
+    """Materialized wide answer table of a form: one row per response, one column per question"""
+    form = models.OneToOneField(FormTemplate, on_delete=models.CASCADE, related_name='answer_matrix')
+    # Normalized question ids, in form order; a mismatch with the structure means the matrix is stale
+    columns = models.JSONField(default=list)
+    row_count = models.PositiveIntegerField(default=0)
+    # Form data version the rows reflect; a newer form version means appends were missed
+    source_version = models.PositiveBigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'Answer matrix for {self.form_id} ({self.row_count} rows)'
+
+
+class FormAnswerMatrixChunk(models.Model):
+    """Fixed-size slice of a FormAnswerMatrix so appends only rewrite the last chunk"""
+    matrix = models.ForeignKey(FormAnswerMatrix, on_delete=models.CASCADE, related_name='chunks')
+    index = models.PositiveIntegerField()
+    # [response_id, submitted_at, submitted_by_id, team_identifier, teammate_name, *answers]
+    rows = models.JSONField(default=list)
+    row_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ['matrix', 'index']
+        ordering = ['index']
+
+    def __str__(self):
+        return f'Chunk {self.index} of matrix {self.matrix_id}'
+
+
+class SubmissionReceipt(models.Model):
+    """Client idempotency token of a stored submission, so retries don't create duplicates"""
+    form = models.ForeignKey(FormTemplate, on_delete=models.CASCADE, related_name='submission_receipts')
+    submitted_by = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='submission_receipts')
+    token = models.CharField(max_length=64)
+    # FormResponse ids created by the submission
+    response_ids = models.JSONField(default=list)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ['submitted_by', 'token']
+
+    def __str__(self):
+        return f'Receipt {self.token} for form {self.form_id} by {self.submitted_by_id}'
+
+
+class QueuedSubmission(models.Model):
+    """Finalized evaluation waiting for the drain_submission_queue worker to store it"""
+    form = models.ForeignKey(FormTemplate, on_delete=models.CASCADE, related_name='queued_submissions')
+    submitted_by = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='queued_submissions')
+    team_identifier = models.CharField(max_length=255, blank=True, null=True)
+    token = models.CharField(max_length=64)
+    # [[teammate name, {question key: answer}], ...]
+    entries = models.JSONField(default=list)
+    queued_at = models.DateTimeField(auto_now_add=True)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now, db_index=True)
+    last_error = models.TextField(blank=True)
+    failed = models.BooleanField(default=False)
+
+    class Meta:
+        unique_together = ['submitted_by', 'token']
+        ordering = ['id']
+
+    def __str__(self):
+        return f'Queued submission {self.token} for form {self.form_id} by {self.submitted_by_id}'
+
+
+class EvaluationDraft(models.Model):
+    """In-progress peer evaluation of a student (team setup and position in the flow)"""
+    student = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='evaluation_drafts')
+    form = models.ForeignKey(FormTemplate, on_delete=models.CASCADE, related_name='evaluation_drafts')
+    team_identifier = models.CharField(max_length=255)
+    teammate_names = models.JSONField(default=list)
+    current_index = models.PositiveIntegerField(default=0)
+    submission_token = models.CharField(max_length=64, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        unique_together = ['student', 'form']
+
+    def evaluations(self):
+        """Saved teammate evaluations as [{'teammate': ..., 'answers': {...}}], oldest first"""
+        return [
+            {'teammate': teammate, 'answers': answers}
+            for teammate, answers in self.answers.order_by('saved_at', 'id').values_list('teammate', 'answers')
+        ]
+
+    def __str__(self):
+        return f'Draft of {self.student_id} for form {self.form_id}'
+
+
+class EvaluationDraftAnswer(models.Model):
+    """One teammate's answers inside an EvaluationDraft, written independently of the others"""
+    draft = models.ForeignKey(EvaluationDraft, on_delete=models.CASCADE, related_name='answers')
+    teammate = models.CharField(max_length=255)
+    answers = models.JSONField(default=dict)
+    saved_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['draft', 'teammate']
+
+    def __str__(self):
+        return f'Draft answers for {self.teammate}'
@@ -0,0 +1,27 @@
+"""
+Opaque cursors for keyset pagination.
+
+A cursor encodes the sort key of the last row on a page (a timestamp and an
+id tie-breaker), so the next page is a range condition on indexed columns
+instead of an OFFSET scan.
+"""
+import base64
+from datetime import datetime
+
+
+def encode_cursor(timestamp, row_id):
+    raw = f'{timestamp.isoformat()}|{row_id}'
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """Return (timestamp, id) for a cursor, or None if it is missing or invalid"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8')
+        timestamp, row_id = raw.rsplit('|', 1)
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (ValueError, UnicodeError):
+        return None
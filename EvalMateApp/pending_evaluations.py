@@ -0,0 +1,120 @@
+"""
+Pending evaluations list for the student dashboard.
+
+The list is one projected query: form columns and the team-size settings
+are selected directly (the structure JSON is never loaded), the creator's
+username comes from the same join, and the status bucket is a CASE on the
+indexed deadline columns.
+
+The serialized payload is cached per student under two data versions: the
+student's (bumped by ``pending_changed`` whenever their pending set changes)
+and their institution's (bumped when a form is published, unpublished,
+edited, deleted or closed). Days left and the urgent status are counted in
+local calendar days, so they only change at local midnight; the entry expires
+then, or when a listed deadline passes.
+
+The API's ETag (``etag_keys``) is built from the same two versions and the
+local date, all of which every worker reads alike. A passed deadline reaches
+it when the deadline sweeper closes the form and bumps both versions.
+"""
+from datetime import datetime, time, timedelta
+
+from django.core.cache import cache
+from django.db.models import Case, F, Q, Value, When
+from django.utils import timezone
+
+from .models import PendingEvaluation
+from . import versions
+
+# Forms due within this many calendar days are 'urgent'
+URGENT_DAYS = 3
+CACHE_TTL = 10 * 60  # upper bound; the versions, deadlines and midnight cut it shorter
+
+
+def _local_midnight(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def compute_pending(student, now=None):
+    """Serialized pending evaluations of a student, soonest deadline first"""
+    now = now or timezone.now()
+    today = timezone.localdate(now)
+    urgent_before = _local_midnight(today + timedelta(days=URGENT_DAYS + 1))
+    rows = PendingEvaluation.objects.filter(student=student).annotate(
+        status=Case(
+            When(Q(form__is_closed=True) | Q(form__due_at__lt=now), then=Value('expired')),
+            When(form__due_at__lt=urgent_before, then=Value('urgent')),
+            default=Value('not_started'),
+        ),
+    ).order_by(F('form__due_at').asc(nulls_last=True), '-added_at').values_list(
+        'id', 'form_id', 'form__title', 'form__description', 'form__course_id',
+        'form__created_by__user__username', 'added_at', 'form__due_at', 'status',
+        'form__structure__settings__minTeamSize',
+        'form__structure__settings__maxTeamSize',
+        'form__structure__settings__allowSelfEvaluation',
+    )
+
+    evaluations = []
+    for (pending_id, form_id, title, description, course, creator, added_at, due_at, status,
+         min_team_size, max_team_size, allow_self_eval) in rows:
+        days_left = None
+        if due_at:
+            days_left = 0 if status == 'expired' else max(0, (timezone.localdate(due_at) - today).days)
+        evaluations.append({
+            'id': pending_id,
+            'form_id': form_id,
+            'title': title,
+            'description': description,
+            'course': course,
+            'created_by': creator or 'Unknown',
+            'added_at': added_at.isoformat(),
+            'days_left': days_left,
+            'due_date': timezone.localtime(due_at).isoformat() if due_at else None,
+            'status': status,
+            'has_draft': False,
+            'is_expired': status == 'expired',
+            'team_settings': {
+                'min_team_size': 'N/A' if min_team_size is None else min_team_size,
+                'max_team_size': 'N/A' if max_team_size is None else max_team_size,
+                'allow_self_evaluation': allow_self_eval or False,
+            },
+        })
+    return evaluations
+
+
+def _seconds_until_change(evaluations, now):
+    # days_left and the urgent status tick at local midnight; a deadline passing expires its row
+    midnight = _local_midnight(timezone.localdate(now) + timedelta(days=1))
+    ttl = min(CACHE_TTL, (midnight - now).total_seconds())
+    for evaluation in evaluations:
+        if evaluation['due_date'] and not evaluation['is_expired']:
+            ttl = min(ttl, (datetime.fromisoformat(evaluation['due_date']) - now).total_seconds())
+    return max(1, int(ttl))
+
+
+def student_pending(student):
+    """Cached ``compute_pending`` for the dashboard API"""
+    student_version = versions.get_version('student', student.id)
+    institution_version = versions.get_version('institution', student.institution)
+    cache_key = f'pending_evaluations:{student.id}:{student_version}:{institution_version}'
+    evaluations = cache.get(cache_key)
+    if evaluations is None:
+        now = timezone.now()
+        evaluations = compute_pending(student, now)
+        ttl = _seconds_until_change(evaluations, now)
+        cache.set(cache_key, evaluations, ttl)
+    return evaluations
+
+
+def etag_keys(request, *args, **kwargs):
+    """``versioned_etag`` keys of the pending list; ``versioned_etag`` adds the local date"""
+    try:
+        student = request.user.profile
+    except Exception:
+        return None
+    return [('student', student.id), ('institution', student.institution)]
+
+
+def pending_changed(student):
+    """Call after adding or removing pending evaluations of ``student``"""
+    versions.bump('student', student.id)
@@ -0,0 +1,166 @@
+"""
+Compiled form schemas.
+
+A form's structure is walked once, when it is published, into a compact
+JSON description stored on FormTemplate.compiled_schema: the question index,
+per-question validation limits, team settings and the parsed due date.
+``get_schema`` wraps it in a FormSchema object that is cached per process by
+(form id, structure hash), so the evaluation and report views no longer
+re-walk ``structure['sections'][*]['questions']`` on every request.
+
+Forms saved before compiled schemas existed are compiled and persisted on
+first use.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from datetime import datetime
+
+from django.utils import timezone
+
+from .models import FormTemplate, parse_due_date
+from .answer_matrix import NUMERIC_TYPES, normalize_question_key, question_index
+
+SCHEMA_VERSION = 2
+PROCESS_CACHE_SIZE = 256
+DEFAULT_CHARACTER_LIMIT = 500
+
+_schemas = OrderedDict()
+
+
+def structure_hash(structure):
+    """Stable hash of a form structure"""
+    encoded = json.dumps(structure, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha1(encoded.encode('utf-8')).hexdigest()
+
+
+def _number(value, default):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _compile_question(question):
+    options = question.get('options') or {}
+    compiled = {
+        'id': normalize_question_key(question.get('id')),
+        'type': question.get('type'),
+        'text': question.get('text', 'Question'),
+        'required': bool(question.get('required')),
+    }
+    if question.get('type') == 'text':
+        compiled['limit'] = options.get('characterLimit', DEFAULT_CHARACTER_LIMIT)
+    elif question.get('type') == 'rating':
+        compiled['min'], compiled['max'] = 1.0, _number(options.get('max'), 5.0)
+    elif question.get('type') == 'slider':
+        compiled['min'], compiled['max'] = _number(options.get('min'), 0.0), _number(options.get('max'), 100.0)
+    return compiled
+
+
+def compile_structure(structure, due_date=None):
+    """JSON-serializable compiled schema of a form structure"""
+    questions, _ = question_index(structure)
+    settings = structure.get('settings', {}) if isinstance(structure, dict) else {}
+    return {
+        'version': SCHEMA_VERSION,
+        'questions': [_compile_question(q) for q in questions],
+        'settings': settings,
+        'team': {
+            'min_size': settings.get('minTeamSize', 2),
+            'max_size': settings.get('maxTeamSize', 10),
+            'allow_self_evaluation': settings.get('allowSelfEvaluation', False),
+            'anonymous': settings.get('anonymousEvaluations', False),
+        },
+        'due_at': due_date.isoformat() if due_date else None,
+    }
+
+
+def compile_form(form):
+    """Compile ``form.structure`` onto the form (the caller saves it)"""
+    form.due_at = parse_due_date(form.structure, form.pk)
+    # A moved or removed deadline reopens the form; closing is left to the sweeper
+    if form.due_at is None or form.due_at > timezone.now():
+        form.is_closed = False
+    form.compiled_schema = compile_structure(form.structure, form.due_at)
+    form.structure_hash = structure_hash(form.structure)
+
+
+class FormSchema:
+    """Read-only view of a compiled schema"""
+
+    def __init__(self, structure, compiled):
+        # Raw question dicts (templates render their options), keyed by normalized id
+        self.questions, self.question_map = question_index(structure)
+        self.rules = {q['id']: q for q in compiled['questions']}
+        self.settings = compiled['settings']
+        team = compiled['team']
+        self.min_team_size = team['min_size']
+        self.max_team_size = team['max_size']
+        self.allow_self_evaluation = team['allow_self_evaluation']
+        self.is_anonymous = team['anonymous']
+        self.due_date = datetime.fromisoformat(compiled['due_at']) if compiled['due_at'] else None
+
+    def question(self, key):
+        """Question for a 'question_<id>' or '<id>' key"""
+        return self.question_map.get(normalize_question_key(key))
+
+    def clean_answers(self, answers):
+        """{'question_<id>': answer text} of a JSON answers dict, dropping unknown questions.
+
+        Lists (checkbox answers) are joined like the HTML form flow stores them.
+        """
+        cleaned = {}
+        for key, answer in answers.items():
+            question_id = normalize_question_key(key)
+            if question_id not in self.question_map or answer is None:
+                continue
+            if isinstance(answer, list):
+                answer = ', '.join(str(a) for a in answer)
+            cleaned[f'question_{question_id}'] = answer if isinstance(answer, str) else str(answer)
+        return cleaned
+
+    def validate_answers(self, answers):
+        """Error messages for {question key: answer} that miss required questions or break their limits"""
+        errors = []
+        answered = {normalize_question_key(key) for key, answer in answers.items() if str(answer).strip()}
+        for question_id, rule in self.rules.items():
+            if rule.get('required') and question_id not in answered:
+                errors.append(f"{rule['text']}: This question is required")
+        for key, answer in answers.items():
+            rule = self.rules.get(normalize_question_key(key))
+            if rule is None:
+                continue
+            if rule['type'] == 'text' and len(answer) > rule['limit']:
+                errors.append(
+                    f"{rule['text']}: Response exceeds {rule['limit']} character limit "
+                    f"(current: {len(answer)} characters)"
+                )
+            elif rule['type'] in NUMERIC_TYPES and answer != '':
+                value = _number(answer, None)
+                if value is None or not rule['min'] <= value <= rule['max']:
+                    errors.append(f"{rule['text']}: Score must be between {rule['min']:g} and {rule['max']:g}")
+        return errors
+
+
+def get_schema(form):
+    """Cached FormSchema of a form, compiling and persisting it if missing"""
+    compiled = form.compiled_schema
+    if not form.structure_hash or not compiled or compiled.get('version') != SCHEMA_VERSION:
+        compile_form(form)
+        compiled = form.compiled_schema
+        if form.pk:
+            FormTemplate.objects.filter(pk=form.pk).update(
+                compiled_schema=compiled, structure_hash=form.structure_hash, due_at=form.due_at,
+            )
+
+    key = (form.pk, form.structure_hash)
+    schema = _schemas.get(key)
+    if schema is None:
+        schema = FormSchema(form.structure, compiled)
+        _schemas[key] = schema
+        if len(_schemas) > PROCESS_CACHE_SIZE:
+            _schemas.popitem(last=False)
+    else:
+        _schemas.move_to_end(key)
+    return schema
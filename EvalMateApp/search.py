@@ -0,0 +1,155 @@
+"""
+Form discovery search for students.
+
+Visibility (published, same institution) is applied in SQL and results are
+returned a page at a time. On PostgreSQL the title and course id are matched
+with full-text search, pg_trgm word similarity and substring matching, so
+partial words and typos still find a form; results are ranked by the
+combined score. The matching GIN indexes are created by migration 0029 and
+must use the same expressions as DOCUMENT_SQL below.
+
+Other databases (SQLite in development) fall back to ``icontains`` matching,
+newest forms first.
+
+Result pages are cached per (institution, department, normalized query,
+page) under the institution's data version, which publish, unpublish, edit,
+delete and the deadline sweeper bump. Only fields shared by every student
+of that institution and department are cached; callers overlay per-student
+fields such as ``is_pending``, and expiry is re-evaluated on every read.
+The dashboard reaches it when the student presses Enter or autocomplete
+finds nothing.
+"""
+import hashlib
+from datetime import datetime
+
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+from django.utils import timezone
+
+from .models import FormTemplate
+from . import versions
+
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 50
+CACHE_TTL = 10 * 60  # entries are also invalidated by the institution version
+
+# Keep in sync with the index in migration 0029
+DOCUMENT_SQL = "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(course_id, ''))"
+
+# Columns the search results need; the structure JSON is never loaded
+RESULT_FIELDS = ('id', 'title', 'course_id', 'institution', 'privacy', 'passcode', 'created_at', 'due_at', 'is_closed')
+
+
+def visible_forms(profile):
+    """Published forms of the student's institution"""
+    if not profile.institution:
+        return FormTemplate.objects.none()
+    return FormTemplate.objects.filter(
+        institution=profile.institution,
+        privacy__in=['institution', 'institution_course'],
+    ).only(*RESULT_FIELDS)
+
+
+def _escape_like(value):
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _ranked(qs, query):
+    tsquery = "websearch_to_tsquery('simple', %s)"
+    contains = f'%{_escape_like(query)}%'
+    # <% is pg_trgm's word similarity operator (query close to some word run of
+    # the title, default threshold 0.6) and % whole-string similarity (0.3), both
+    # escaped for the DB driver. ILIKE keeps every substring match icontains had.
+    # All of them can use the trigram indexes.
+    matched = RawSQL(
+        f'{DOCUMENT_SQL} @@ {tsquery} OR %s <%% title OR course_id %% %s '
+        f'OR title ILIKE %s OR course_id ILIKE %s',
+        [query, query, query, contains, contains],
+        output_field=BooleanField(),
+    )
+    rank = RawSQL(
+        f'ts_rank({DOCUMENT_SQL}, {tsquery}) + greatest(word_similarity(%s, title), similarity(course_id, %s))',
+        [query, query, query],
+        output_field=FloatField(),
+    )
+    return qs.filter(matched).annotate(rank=rank).order_by('-rank', '-id')
+
+
+def search_forms(profile, query, page=1, page_size=PAGE_SIZE):
+    """(forms on the page, has_more) for a student's search query"""
+    query = (query or '').strip()
+    if not query:
+        return [], False
+    page = max(1, page)
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+
+    qs = visible_forms(profile)
+    if connection.vendor == 'postgresql':
+        qs = _ranked(qs, query)
+    else:
+        qs = qs.filter(Q(course_id__icontains=query) | Q(title__icontains=query)).order_by('-created_at', '-id')
+
+    # Fetch one extra row to know whether another page exists
+    offset = (page - 1) * page_size
+    forms = list(qs[offset:offset + page_size + 1])
+    return forms[:page_size], len(forms) > page_size
+
+
+
+def normalize_query(query):
+    return ' '.join((query or '').casefold().split())
+
+
+def result_row(form, department):
+    """Search result fields shared by every student of an institution and department"""
+    due_date = form.due_date
+    department_mismatch = form.privacy == 'institution_course' and not (
+        form.course_id and department and form.course_id.lower() == department.lower()
+    )
+    return {
+        'id': form.id,
+        'title': form.title,
+        'course_id': form.course_id,
+        'created_at': form.created_at.isoformat(),
+        'requires_passcode': bool(form.passcode),
+        'is_closed': form.is_closed,
+        'due_at': due_date.isoformat() if due_date else None,
+        'due_date_str': due_date.strftime("%B %d, %Y at %I:%M %p") if due_date else None,
+        'department_mismatch': department_mismatch,
+        'required_department': form.course_id if form.privacy == 'institution_course' else None,
+    }
+
+
+def cached_search(profile, query, page=1, page_size=PAGE_SIZE):
+    """(result rows, has_more) for a search, shared across the institution's students.
+
+    Each row gets a fresh ``is_expired``; ``is_pending`` is left to the caller.
+    """
+    query = normalize_query(query)
+    if not query or not profile.institution:
+        return [], False
+    page = max(1, page)
+    page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+
+    department = (profile.department or '').casefold()
+    version = versions.get_version('institution', profile.institution)
+    digest = hashlib.md5('|'.join([profile.institution, department, query]).encode('utf-8')).hexdigest()
+    cache_key = f'form_search:{version}:{digest}:{page}:{page_size}'
+
+    cached = cache.get(cache_key)
+    if cached is None:
+        forms, has_more = search_forms(profile, query, page, page_size)
+        cached = ([result_row(f, profile.department) for f in forms], has_more)
+        cache.set(cache_key, cached, CACHE_TTL)
+
+    rows, has_more = cached
+    now = timezone.now()
+    results = []
+    for row in rows:
+        row = dict(row)
+        due_at = row.pop('due_at')
+        row['is_expired'] = row.pop('is_closed') or (due_at is not None and now > datetime.fromisoformat(due_at))
+        results.append(row)
+    return results, has_more
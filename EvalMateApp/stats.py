@@ -0,0 +1,124 @@
+"""
+Maintained submission rollups for the faculty reports pages.
+
+The counters live in FormSubmissionStats / FormDailySubmissions and are updated
+by the submit path and the mark-read paths inside their transactions, so the
+reports pages can read every form's numbers in a single query.
+"""
+from django.db import transaction
+from django.db.models import F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from .models import FormTemplate, FormResponse, FormSubmissionStats, FormDailySubmissions
+from . import versions
+
+
+def record_submission(form, submitted_by, team_identifier, response_ids, submitted_at=None):
+    """Update the rollups after a submission's responses were created.
+
+    Must run inside the same transaction that created ``response_ids``.
+    ``submitted_at`` defaults to now (queued submissions pass their queue time).
+    """
+    if not response_ids:
+        return
+
+    today = timezone.localdate(submitted_at) if submitted_at else timezone.localdate()
+    earlier = FormResponse.objects.filter(
+        form=form,
+        submitted_by=submitted_by,
+        team_identifier=team_identifier,
+    ).exclude(id__in=response_ids)
+
+    # A resubmission for the same (student, team) is still one submission
+    is_new_group = not earlier.exists()
+    is_new_today = is_new_group or not earlier.filter(submitted_at__date=today).exists()
+
+    FormSubmissionStats.objects.get_or_create(form=form)
+    FormSubmissionStats.objects.filter(form=form).update(
+        total_submissions=F('total_submissions') + (1 if is_new_group else 0),
+        unread_responses=F('unread_responses') + len(response_ids),
+        updated_at=timezone.now(),
+    )
+
+    if is_new_today:
+        FormDailySubmissions.objects.get_or_create(form=form, day=today)
+        FormDailySubmissions.objects.filter(form=form, day=today).update(
+            submissions=F('submissions') + 1
+        )
+
+
+def record_read(form_id, count):
+    """Decrement the unread counter after ``count`` responses were marked as read"""
+    if not count:
+        return
+    FormSubmissionStats.objects.filter(form_id=form_id).update(
+        unread_responses=Greatest(F('unread_responses') - count, Value(0)),
+        updated_at=timezone.now(),
+    )
+
+
+def mark_read(form_id, responses):
+    """Mark the unread rows of a FormResponse queryset as read in one UPDATE.
+
+    The unread counter is adjusted in the same transaction; returns the number
+    of responses that changed state.
+    """
+    with transaction.atomic():
+        marked = responses.filter(form_id=form_id, is_read=False).update(is_read=True)
+        record_read(form_id, marked)
+        if marked:
+            # The faculty dashboards show unread counts
+            owner = FormTemplate.objects.filter(id=form_id).values_list('created_by_id', flat=True).first()
+            versions.bump('faculty', owner)
+    return marked
+
+
+def unread_count(form_id):
+    """Maintained unread counter of a form"""
+    return FormSubmissionStats.objects.filter(
+        form_id=form_id
+    ).values_list('unread_responses', flat=True).first() or 0
+
+
+def forms_with_stats(profile):
+    """Faculty forms annotated with total, today's and unread counts (one query)"""
+    today = timezone.localdate()
+    todays_bucket = FormDailySubmissions.objects.filter(
+        form=OuterRef('pk'),
+        day=today,
+    ).values('submissions')[:1]
+
+    return FormTemplate.objects.filter(
+        created_by=profile
+    ).annotate(
+        total_submissions=Coalesce(F('stats__total_submissions'), Value(0)),
+        unread_submissions=Coalesce(F('stats__unread_responses'), Value(0)),
+        todays_submissions=Coalesce(Subquery(todays_bucket), Value(0)),
+    ).order_by('-created_at')
+
+
+def rebuild_form_stats(form):
+    """Recompute a form's rollups from its responses (backfill and recovery)"""
+    responses = FormResponse.objects.filter(form=form)
+
+    groups = responses.values('submitted_by_id', 'team_identifier').distinct().count()
+    unread = responses.filter(is_read=False).count()
+
+    # Unique groups per local day
+    day_groups = {}
+    rows = responses.values_list('submitted_by_id', 'team_identifier', 'submitted_at')
+    for submitted_by_id, team_identifier, submitted_at in rows.iterator(chunk_size=2000):
+        day = timezone.localtime(submitted_at).date()
+        day_groups.setdefault(day, set()).add((submitted_by_id, team_identifier))
+
+    FormSubmissionStats.objects.update_or_create(
+        form=form,
+        defaults={'total_submissions': groups, 'unread_responses': unread},
+    )
+    FormDailySubmissions.objects.filter(form=form).delete()
+    FormDailySubmissions.objects.bulk_create([
+        FormDailySubmissions(form=form, day=day, submissions=len(keys))
+        for day, keys in day_groups.items()
+    ])
+    return groups, unread
@@ -0,0 +1,191 @@
+"""
+Batched, idempotent writer for student submissions.
+
+A submission is one FormResponse per evaluated teammate (or a single response
+for plain forms) plus their answers, with the typed question id and score
+columns filled in. They are written with two bulk INSERTs
+inside one transaction, together with the reports rollups, the faculty
+activity feed, the form, student and faculty data versions, the version of the
+student's evaluation details for the team and the persisted answer matrix.
+
+With ANSWER_STORAGE_MODE = 'document' the answers are stored as one document
+on each FormResponse, and ResponseAnswer rows are only written for scored
+(rating/slider) answers, which the SQL analytics aggregate.
+
+An optional client token makes the write idempotent: the first request with a
+given (student, token) stores a SubmissionReceipt, and any retry or
+double-click with the same token gets the original response ids back instead
+of a second submission.
+
+With SUBMISSION_QUEUE_ENABLED the evaluation flow only appends a
+QueuedSubmission row (one small INSERT) and ``drain_queue`` stores it later,
+keeping the original submission time.
+"""
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from .models import FormResponse, ResponseAnswer, SubmissionReceipt, QueuedSubmission
+from .answer_matrix import question_index, typed_answer
+from . import activity, evaluation_history, form_matrix, stats, versions
+
+MAX_TOKEN_LENGTH = 64
+MAX_QUEUE_ATTEMPTS = 5
+RETRY_BACKOFF = timedelta(seconds=30)  # doubled after every failed attempt
+
+
+def clean_token(token):
+    """Normalize a client token; None when missing or unusable"""
+    token = (token or '').strip()
+    if not token or len(token) > MAX_TOKEN_LENGTH:
+        return None
+    return token
+
+
+def find_receipt(submitted_by, token):
+    """Receipt of an already stored submission with this token, if any"""
+    token = clean_token(token)
+    if token is None:
+        return None
+    return SubmissionReceipt.objects.filter(submitted_by=submitted_by, token=token).first()
+
+
+def already_submitted(submitted_by, token):
+    """True if this token was stored or is waiting in the submission queue"""
+    token = clean_token(token)
+    if token is None:
+        return False
+    return (
+        SubmissionReceipt.objects.filter(submitted_by=submitted_by, token=token).exists()
+        or QueuedSubmission.objects.filter(submitted_by=submitted_by, token=token).exists()
+    )
+
+
+def write_submission(form, submitted_by, entries, team_identifier=None, token=None, submitted_at=None):
+    """Store a submission and return (response ids, created).
+
+    ``entries`` is a list of (teammate name or None, {question key: answer}),
+    one per FormResponse. ``created`` is False when ``token`` was already used
+    by this student, in which case nothing is written. ``submitted_at``
+    overrides the submission time (queued submissions).
+    """
+    token = clean_token(token)
+    as_document = settings.ANSWER_STORAGE_MODE == 'document'
+
+    with transaction.atomic():
+        receipt = None
+        if token:
+            try:
+                with transaction.atomic():
+                    receipt = SubmissionReceipt.objects.create(
+                        form=form, submitted_by=submitted_by, token=token,
+                    )
+            except IntegrityError:
+                # Same token already stored (or being stored by a concurrent request)
+                existing = SubmissionReceipt.objects.get(submitted_by=submitted_by, token=token)
+                return existing.response_ids, False
+
+        responses = FormResponse.objects.bulk_create([
+            FormResponse(
+                form=form,
+                submitted_by=submitted_by,
+                team_identifier=team_identifier,
+                teammate_name=teammate_name,
+                answers_doc=[[question, answer] for question, answer in answers.items()] if as_document else None,
+            )
+            for teammate_name, answers in entries
+        ])
+        _, question_map = question_index(form.structure)
+        answer_rows = []
+        for response, (_, answers) in zip(responses, entries):
+            for question, answer in answers.items():
+                question_id, numeric_value = typed_answer(question, answer, question_map)
+                if as_document and numeric_value is None:
+                    continue
+                answer_rows.append(ResponseAnswer(
+                    response=response, question=question, answer=answer,
+                    question_id=question_id, numeric_value=numeric_value,
+                ))
+        ResponseAnswer.objects.bulk_create(answer_rows)
+        response_ids = [response.id for response in responses]
+        if submitted_at is not None:
+            # auto_now_add always stamps the insert time
+            FormResponse.objects.filter(id__in=response_ids).update(submitted_at=submitted_at)
+            for response in responses:
+                response.submitted_at = submitted_at
+
+        # Keep the reports rollups, cache versions and answer matrix in step
+        stats.record_submission(form, submitted_by, team_identifier, response_ids, submitted_at)
+        activity.record_submission(form, submitted_by, team_identifier, response_ids, submitted_at)
+        versions.bump('form', form.id)
+        versions.bump('student', submitted_by.id)
+        versions.bump('faculty', form.created_by_id)
+        versions.bump('evaluation', evaluation_history.group_version_key(form.id, submitted_by.id, team_identifier))
+        form_matrix.append_responses(
+            form, [(response, answers) for response, (_, answers) in zip(responses, entries)]
+        )
+
+        if receipt is not None:
+            receipt.response_ids = response_ids
+            receipt.save(update_fields=['response_ids'])
+
+    return response_ids, True
+
+
+def enqueue_submission(form, submitted_by, entries, team_identifier=None, token=None):
+    """Queue a finalized submission; returns False if the token was already queued"""
+    try:
+        with transaction.atomic():
+            QueuedSubmission.objects.create(
+                form=form,
+                submitted_by=submitted_by,
+                team_identifier=team_identifier,
+                # The queue needs a token to stay idempotent between request and worker
+                token=clean_token(token) or uuid.uuid4().hex,
+                entries=[[teammate, answers] for teammate, answers in entries],
+            )
+            versions.bump('student', submitted_by.id)
+    except IntegrityError:
+        return False
+    return True
+
+
+def drain_queue(batch_size=50):
+    """Store one batch of due queued submissions; returns (stored, failed).
+
+    Rows are claimed with SKIP LOCKED so several workers can run at once;
+    only the queue rows are locked, not the joined forms and profiles.
+    Each submission gets its own savepoint: a failure is recorded on the row
+    and retried with exponential backoff, up to MAX_QUEUE_ATTEMPTS.
+    """
+    stored = failed = 0
+    with transaction.atomic():
+        batch = list(QueuedSubmission.objects.select_for_update(skip_locked=True, of=('self',)).filter(
+            failed=False,
+            next_attempt_at__lte=timezone.now(),
+        ).select_related('form', 'submitted_by').order_by('id')[:batch_size])
+
+        for item in batch:
+            try:
+                with transaction.atomic():
+                    write_submission(
+                        item.form,
+                        item.submitted_by,
+                        [(teammate, answers) for teammate, answers in item.entries],
+                        team_identifier=item.team_identifier,
+                        token=item.token,
+                        submitted_at=item.queued_at,
+                    )
+                    item.delete()
+                stored += 1
+            except Exception as e:
+                item.attempts += 1
+                item.last_error = str(e)
+                item.failed = item.attempts >= MAX_QUEUE_ATTEMPTS
+                item.next_attempt_at = timezone.now() + RETRY_BACKOFF * (2 ** (item.attempts - 1))
+                item.save(update_fields=['attempts', 'last_error', 'failed', 'next_attempt_at'])
+                failed += 1
+    return stored, failed
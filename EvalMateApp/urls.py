@@ -16,11 +16,15 @@ urlpatterns = [
     path('dashboard/faculty/profile/', views.faculty_profile_view, name='faculty_profile'),
     path('dashboard/faculty/reports/', views.faculty_reports_view, name='faculty_reports'),
     path('dashboard/faculty/reports/<int:form_id>/', views.faculty_form_responses_view, name='faculty_form_responses'),
+    path('dashboard/faculty/reports/<int:form_id>/mark-read/', views.faculty_mark_read_api, name='faculty_mark_read_api'),
+    path('dashboard/faculty/reports/<int:form_id>/export/', views.faculty_export_responses_view, name='faculty_export_responses'),
     path('dashboard/faculty/reports/<int:form_id>/student/<int:student_id>/team/<str:team_id>/', views.faculty_student_responses_view, name='faculty_student_responses'),
+    path('dashboard/faculty/reports/<int:form_id>/student/<int:student_id>/team/<str:team_id>/teammates/', views.faculty_group_teammates_api, name='faculty_group_teammates_api'),
     path('dashboard/faculty/reports/<int:form_id>/responses/<int:response_id>/', views.faculty_response_detail_view, name='faculty_response_detail'),
 
     # Student form discovery / access
     path('forms/search/', views.student_search_forms, name='forms_search'),
+    path('forms/autocomplete/', views.student_autocomplete_forms, name='forms_autocomplete'),
     path('forms/<int:form_id>/', views.student_form_view, name='student_form_view'),
     path('forms/<int:form_id>/access/', views.student_form_access, name='student_form_access'),
     path('forms/<int:form_id>/submit/', views.student_form_submit, name='student_form_submit'),
@@ -30,6 +34,7 @@ urlpatterns = [
     path('forms/<int:form_id>/eval/evaluations/', views.student_eval_evaluations, name='student_eval_evaluations'),
     path('forms/<int:form_id>/eval/submit-evaluation/', views.student_eval_submit_evaluation, name='student_eval_submit_evaluation'),
     path('forms/<int:form_id>/eval/navigate/<int:teammate_index>/', views.student_eval_navigate_teammate, name='student_eval_navigate_teammate'),
+    path('api/forms/<int:form_id>/eval/submit/', views.api_submit_team_evaluation, name='api_submit_team_evaluation'),
     
     # API endpoints
     path('api/publish-form', views.api_publish_form, name='api_publish_form'),
@@ -55,4 +60,5 @@ urlpatterns = [
     path('api/faculty/form-builder-content/', views.api_faculty_form_builder_content, name='api_faculty_form_builder_content'),
     path('api/faculty/reports-content/', views.api_faculty_reports_content, name='api_faculty_reports_content'),
     path('api/faculty/profile-content/', views.api_faculty_profile_content, name='api_faculty_profile_content'),
+    path('api/faculty/students/<int:student_id>/trajectory/', views.api_faculty_student_trajectory, name='api_faculty_student_trajectory'),
 ]
\ No newline at end of file
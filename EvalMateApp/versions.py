@@ -0,0 +1,72 @@
+"""
+Data version counters for cache keys.
+
+Each (scope, key) pair has a counter stored in DataVersion. Readers put the
+current version into their cache keys; writers bump it inside the same
+transaction as the data change, so stale entries are simply never read again.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from .models import DataVersion
+
+
+def get_version(scope, key):
+    """Current version of (scope, key); 0 if it was never bumped"""
+    version = DataVersion.objects.filter(
+        scope=scope, key=str(key)
+    ).values_list('version', flat=True).first()
+    return version or 0
+
+
+def get_versions(scope, keys):
+    """Current versions for several keys of one scope in a single query"""
+    keys = [str(k) for k in keys]
+    found = dict(DataVersion.objects.filter(
+        scope=scope, key__in=keys
+    ).values_list('key', 'version'))
+    return {k: found.get(k, 0) for k in keys}
+
+
+def get_many(pairs):
+    """Current versions of several (scope, key) pairs in a single query"""
+    pairs = [(scope, str(key)) for scope, key in pairs]
+    if not pairs:
+        return {}
+    condition = Q()
+    for scope, key in pairs:
+        condition |= Q(scope=scope, key=key)
+    found = {
+        (scope, key): version
+        for scope, key, version in DataVersion.objects.filter(condition).values_list('scope', 'key', 'version')
+    }
+    return {pair: found.get(pair, 0) for pair in pairs}
+
+
+def scope_versions(scope):
+    """{key: version} of every key of ``scope`` that was ever bumped"""
+    return dict(DataVersion.objects.filter(scope=scope).values_list('key', 'version'))
+
+
+def bump(scope, *keys):
+    """Increment the version of every given key in ``scope``"""
+    keys = {str(k) for k in keys if k is not None}
+    if not keys:
+        return
+
+    DataVersion.objects.filter(scope=scope, key__in=keys).update(
+        version=F('version') + 1,
+        updated_at=timezone.now(),
+    )
+    existing = set(DataVersion.objects.filter(
+        scope=scope, key__in=keys
+    ).values_list('key', flat=True))
+
+    for key in keys - existing:
+        try:
+            with transaction.atomic():
+                DataVersion.objects.create(scope=scope, key=key, version=1)
+        except IntegrityError:
+            # Created concurrently - count our bump on top of it
+            DataVersion.objects.filter(scope=scope, key=key).update(version=F('version') + 1)
@@ -6,17 +6,26 @@ from django.contrib.auth.decorators import login_required
 from .forms import UserRegisterForm, ProfileForm
 from django.http import JsonResponse, HttpResponseForbidden, HttpResponse
 from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from django.utils import timezone
 from django.db.models import Q
 from django.views.decorators.cache import never_cache, cache_control
 from django.views.decorators.csrf import csrf_exempt
-from django.views.decorators.csrf import csrf_exempt
 
-from .models import FormTemplate, FormResponse, ResponseAnswer, Profile, PendingEvaluation
+from .models import FormTemplate, FormResponse, ResponseAnswer, Profile, PendingEvaluation, FormSubmissionStats
+from . import activity, autocomplete, conditional, drafts, evaluation_history, pending_evaluations, search, stats, submissions, versions
+from .conditional import versioned_etag
+from .analytics import form_analytics, student_trajectory, teammate_lookup
+from .answer_matrix import AnswerMatrix, normalize_question_key
+from .schema import compile_form, get_schema
+from .pagination import encode_cursor, decode_cursor
 
 import json
 import time
 
+# Submission groups per page on the faculty responses list
+RESPONSE_GROUPS_PAGE_SIZE = 25
+
 
 def home_view(request):
     """Redirect authenticated users to their appropriate dashboard"""
@@ -247,19 +256,13 @@ def faculty_dashboard_view(request):
     
     from django.db.models import Count
     
-    # Get recent submissions - one per student (not per teammate rated)
-    # Group by student to show who submitted, not who was rated
-    recent_submissions = FormResponse.objects.filter(
-        form__created_by=profile,
-        submitted_by__isnull=False
-    ).select_related(
-        'form', 'submitted_by'
-    ).order_by('submitted_by', '-submitted_at').distinct('submitted_by')[:3]
+    # Latest submissions of the most recent submitters, from the capped activity feed
+    recent_activity = activity.recent_activity(profile)
     
-    # Get all forms - don't restrict fields since due_date is a property
+    # Get all forms - the deadline is the due_at column, so the structure JSON isn't needed
     forms = FormTemplate.objects.filter(
         created_by=profile
-    ).annotate(
+    ).defer('structure', 'compiled_schema').annotate(
         response_count=Count('responses')
     ).order_by('-created_at')
     
@@ -273,7 +276,7 @@ def faculty_dashboard_view(request):
     context = {
         'user': request.user,
         'profile': profile,
-        'recent_submissions': recent_submissions,
+        'recent_activity': recent_activity,
         'forms': forms_list,
         'total_forms': total_forms,
         'published_forms': published_forms,
@@ -341,41 +344,16 @@ def faculty_reports_view(request):
     if profile.account_type != 'faculty':
         return HttpResponseForbidden('Access denied')
 
-    from django.db.models import Count, Q, Exists, OuterRef
-    
-    today = timezone.localdate()
-    
-    # Optimized query with aggregations
-    forms = FormTemplate.objects.filter(
-        created_by=profile
-    ).only(
-        'id', 'title', 'course_id', 'created_at'
-    ).prefetch_related('responses').order_by('-created_at')
-    
-    forms_data = []
-    for f in forms:
-        # Get responses efficiently
-        responses = f.responses.only('id', 'submitted_by_id', 'team_identifier', 'submitted_at', 'is_read').all()
-        unique_students = set()
-        unique_today = set()
-        has_unread = False
-        
-        for r in responses:
-            student_key = (r.submitted_by_id, r.team_identifier)
-            unique_students.add(student_key)
-            
-            if r.submitted_at.date() == today:
-                unique_today.add(student_key)
-            
-            if not r.is_read:
-                has_unread = True
-        
-        forms_data.append({
+    # Counts come from the maintained rollups, so this is a single query
+    forms_data = [
+        {
             'form': f,
-            'total_submissions': len(unique_students),
-            'todays_submissions': len(unique_today),
-            'unread_submissions': 1 if has_unread else 0,
-        })
+            'total_submissions': f.total_submissions,
+            'todays_submissions': f.todays_submissions,
+            'unread_submissions': f.unread_submissions,
+        }
+        for f in stats.forms_with_stats(profile)
+    ]
 
     response = render(request, 'EvalMateApp/reports_list.html', {
         'forms_data': forms_data, 
@@ -395,43 +373,56 @@ def faculty_form_responses_view(request, form_id):
 
     form = get_object_or_404(FormTemplate.objects.select_related('created_by'), id=form_id, created_by=profile)
     
-    # Group responses by student and team, keeping individual teammates
-    from collections import defaultdict
-    grouped_responses = defaultdict(lambda: {
-        'student': None,
-        'team': None,
-        'teammates': [],
-        'submitted_at': None,
-        'has_unread': False
-    })
+    # One row per (student, team) submission, grouped and ordered in SQL.
+    # Pages are keyset-paginated on (latest submission, first response id).
+    from django.db.models import Count, Max, Min
+    groups = FormResponse.objects.filter(
+        form=form,
+        submitted_by__isnull=False,
+    ).values(
+        'submitted_by_id', 'team_identifier'
+    ).annotate(
+        last_submitted_at=Max('submitted_at'),
+        first_id=Min('id'),
+        teammate_count=Count('id'),
+        unread_count=Count('id', filter=Q(is_read=False)),
+    ).order_by('-last_submitted_at', '-first_id')
+    
+    cursor = decode_cursor(request.GET.get('cursor'))
+    if cursor:
+        cursor_at, cursor_id = cursor
+        groups = groups.filter(
+            Q(last_submitted_at__lt=cursor_at) | Q(last_submitted_at=cursor_at, first_id__lt=cursor_id)
+        )
     
-    all_responses = form.responses.select_related('submitted_by', 'submitted_by__user').order_by('-submitted_at')
+    page = list(groups[:RESPONSE_GROUPS_PAGE_SIZE + 1])
+    has_more = len(page) > RESPONSE_GROUPS_PAGE_SIZE
+    page = page[:RESPONSE_GROUPS_PAGE_SIZE]
     
-    for response in all_responses:
-        key = (response.submitted_by.id, response.team_identifier)
-        group = grouped_responses[key]
-        
-        if group['student'] is None:
-            group['student'] = response.submitted_by
-            group['team'] = response.team_identifier
-            group['submitted_at'] = response.submitted_at
-        
-        # Add each teammate as a separate item
-        group['teammates'].append({
-            'name': response.teammate_name,
-            'response_id': response.id,
-            'is_read': response.is_read,
-            'submitted_at': response.submitted_at
+    # Students of this page only
+    students = Profile.objects.select_related('user').in_bulk(
+        {g['submitted_by_id'] for g in page}
+    )
+    responses_list = []
+    for group in page:
+        responses_list.append({
+            'student': students.get(group['submitted_by_id']),
+            'team': group['team_identifier'],
+            'submitted_at': group['last_submitted_at'],
+            'teammate_count': group['teammate_count'],
+            'has_unread': group['unread_count'] > 0,
         })
-        
-        if not response.is_read:
-            group['has_unread'] = True
     
-    # Convert to list and sort by submission time
-    responses_list = sorted(grouped_responses.values(), key=lambda x: x['submitted_at'], reverse=True)
+    next_cursor = None
+    if has_more:
+        last = page[-1]
+        next_cursor = encode_cursor(last['last_submitted_at'], last['first_id'])
     
-    # Count unique students who submitted (not total teammate evaluations)
-    total_responses = len(responses_list)
+    # Count unique students who submitted and unread responses (maintained rollup)
+    form_stats = FormSubmissionStats.objects.filter(
+        form=form
+    ).values('total_submissions', 'unread_responses').first() or {}
+    total_responses = form_stats.get('total_submissions', 0)
     
     # Check if anonymous evaluations are enabled
     is_anonymous = False
@@ -442,10 +433,154 @@ def faculty_form_responses_view(request, form_id):
         'form': form, 
         'grouped_responses': responses_list,
         'total_responses': total_responses,
-        'is_anonymous': is_anonymous
+        'unread_responses': form_stats.get('unread_responses', 0),
+        'is_anonymous': is_anonymous,
+        'next_cursor': next_cursor,
+        'is_first_page': cursor is None,
+    })
+
+
+@never_cache
+@login_required
+def faculty_mark_read_api(request, form_id):
+    """Mark a whole form, selected submission groups, or everything before a time as read"""
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+    
+    try:
+        profile = request.user.profile
+        if profile.account_type != 'faculty':
+            return JsonResponse({'error': 'Access denied'}, status=403)
+        
+        form = get_object_or_404(FormTemplate.objects.only('id'), id=form_id, created_by=profile)
+        
+        if request.content_type == 'application/json':
+            payload = json.loads(request.body.decode('utf-8') or '{}')
+        else:
+            payload = request.POST
+        scope = payload.get('scope', 'form')
+        
+        responses = FormResponse.objects.filter(form=form)
+        if scope == 'groups':
+            # groups: [{"student_id": 12, "team": "Team A"}, ...]
+            groups = payload.get('groups') or []
+            if isinstance(groups, str):
+                groups = json.loads(groups)
+            condition = Q()
+            for group in groups:
+                team = group.get('team')
+                condition |= Q(
+                    submitted_by_id=int(group['student_id']),
+                    **({'team_identifier': team} if team is not None else {'team_identifier__isnull': True})
+                )
+            if not condition:
+                return JsonResponse({'error': 'No groups selected'}, status=400)
+            responses = responses.filter(condition)
+        elif scope == 'before':
+            from django.utils.dateparse import parse_datetime
+            before = parse_datetime(payload.get('before') or '')
+            if before is None:
+                return JsonResponse({'error': 'Invalid "before" timestamp'}, status=400)
+            if timezone.is_naive(before):
+                before = timezone.make_aware(before)
+            responses = responses.filter(submitted_at__lt=before)
+        elif scope != 'form':
+            return JsonResponse({'error': f'Unknown scope "{scope}"'}, status=400)
+        
+        marked = stats.mark_read(form.id, responses)
+        return JsonResponse({
+            'success': True,
+            'marked': marked,
+            'unread': stats.unread_count(form.id),
+        })
+    
+    except (KeyError, TypeError, ValueError) as e:
+        return JsonResponse({'error': f'Invalid request: {e}'}, status=400)
+    except Exception as e:
+        import traceback
+        print(f"Error marking responses as read: {str(e)}")
+        print(traceback.format_exc())
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@never_cache
+@login_required
+def api_faculty_student_trajectory(request, student_id):
+    """A student's scores across all of the faculty member's forms, oldest first"""
+    profile = request.user.profile
+    if profile.account_type != 'faculty':
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    student = get_object_or_404(Profile, id=student_id, account_type='student')
+    try:
+        return JsonResponse(student_trajectory(profile, student))
+    except Exception as e:
+        import traceback
+        print(f"Error building student trajectory: {str(e)}")
+        print(traceback.format_exc())
+        return JsonResponse({'error': str(e)}, status=500)
+
+
+@never_cache
+@login_required
+def faculty_group_teammates_api(request, form_id, student_id, team_id):
+    """JSON list of the teammate responses in one (student, team) group, loaded on expand"""
+    profile = request.user.profile
+    if profile.account_type != 'faculty':
+        return JsonResponse({'error': 'Access denied'}, status=403)
+    
+    form = get_object_or_404(FormTemplate.objects.only('id'), id=form_id, created_by=profile)
+    teammates = FormResponse.objects.filter(
+        form=form,
+        submitted_by_id=student_id,
+        team_identifier=team_id,
+    ).order_by('id').values('id', 'teammate_name', 'is_read', 'submitted_at')
+    
+    return JsonResponse({
+        'teammates': [
+            {
+                'response_id': t['id'],
+                'name': t['teammate_name'] or 'Unknown',
+                'is_read': t['is_read'],
+                'submitted_at': t['submitted_at'].isoformat(),
+            }
+            for t in teammates
+        ]
     })
 
 
+@never_cache
+@login_required
+def faculty_export_responses_view(request, form_id):
+    """Stream every response of a form as CSV (default) or JSON Lines"""
+    profile = request.user.profile
+    if profile.account_type != 'faculty':
+        return HttpResponseForbidden('Access denied')
+
+    form = get_object_or_404(FormTemplate, id=form_id, created_by=profile)
+
+    export_format = request.GET.get('format', 'csv').lower()
+    if export_format not in ('csv', 'jsonl'):
+        return HttpResponse('Unsupported export format', status=400)
+
+    is_anonymous = False
+    if form.structure and 'settings' in form.structure:
+        is_anonymous = form.structure['settings'].get('anonymousEvaluations', False)
+
+    from django.http import StreamingHttpResponse
+    from django.utils.text import slugify
+    from . import exports
+
+    if export_format == 'csv':
+        response = StreamingHttpResponse(exports.stream_csv(form, is_anonymous), content_type='text/csv; charset=utf-8')
+    else:
+        response = StreamingHttpResponse(exports.stream_jsonl(form, is_anonymous), content_type='application/x-ndjson; charset=utf-8')
+
+    filename = f"{slugify(form.title) or 'form'}-{form.id}-responses.{export_format}"
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
 @never_cache
 @login_required
 def faculty_student_responses_view(request, form_id, student_id, team_id):
@@ -458,43 +593,41 @@ def faculty_student_responses_view(request, form_id, student_id, team_id):
     student = get_object_or_404(Profile, id=student_id, account_type='student')
     
     # Get all responses for this student and team
-    responses = FormResponse.objects.filter(
+    team_responses = FormResponse.objects.filter(
         form=form,
         submitted_by=student,
         team_identifier=team_id
-    ).select_related('submitted_by', 'submitted_by__user').prefetch_related('answers').order_by('id')
+    )
+    responses = list(team_responses.order_by('id'))
     
-    if not responses.exists():
+    if not responses:
         return HttpResponseForbidden('No responses found')
     
     # Mark all as read
-    responses.filter(is_read=False).update(is_read=True)
+    stats.mark_read(form.id, team_responses)
     
-    # Parse form structure to get questions
-    sections = form.structure.get('sections', []) if form.structure else []
-    question_map = {}
-    all_questions = []
+    # Questions from the compiled schema, and every answer of the team in one query
+    schema = get_schema(form)
+    all_questions, question_map = schema.questions, schema.question_map
+    matrix = AnswerMatrix.for_responses(responses)
     
-    for section in sections:
-        for question in section.get('questions', []):
-            question_id = question.get('id')
-            if question_id:
-                question_map[str(question_id)] = question
-                question_map[f"question_{question_id}"] = question
-                all_questions.append(question)
+    # Form-wide score statistics for rating/slider questions (cached per form version)
+    analytics = form_analytics(form)
+    question_stats = {q['id']: q for q in analytics['questions']}
+    teammate_stats = teammate_lookup(analytics)
     
     # Build data for both views
     teammates_data = []
     for response in responses:
-        answers = response.answers.all()
+        received = teammate_stats.get((response.teammate_name or '').strip().casefold(), {})
         enriched_answers = []
-        for answer in answers:
-            question_id = answer.question
-            question_data = question_map.get(question_id, {})
+        for question_id, answer in matrix.answers_for(response.id):
+            question_key = normalize_question_key(question_id)
             enriched_answers.append({
                 'question_id': question_id,
-                'question_data': question_data,
-                'answer': answer.answer,
+                'question_data': question_map.get(question_key, {}),
+                'answer': answer,
+                'stats': received.get('questions', {}).get(question_key),
             })
         
         teammates_data.append({
@@ -511,34 +644,26 @@ def faculty_student_responses_view(request, form_id, student_id, team_id):
         answers_for_question = []
         
         for response in responses:
-            answer_obj = response.answers.filter(question=question_id).first()
-            if not answer_obj:
-                answer_obj = response.answers.filter(question=f"question_{question_id}").first()
-            
             answers_for_question.append({
                 'teammate_name': response.teammate_name,
-                'answer': answer_obj.answer if answer_obj else None,
+                'answer': matrix.get(response.id, question_id),
                 'response_id': response.id
             })
         
         by_question_data.append({
             'question_data': question,
-            'answers': answers_for_question
+            'answers': answers_for_question,
+            'stats': question_stats.get(question_id),
         })
     
-    # Check if anonymous
-    is_anonymous = False
-    if form.structure and 'settings' in form.structure:
-        is_anonymous = form.structure['settings'].get('anonymousEvaluations', False)
-    
     return render(request, 'EvalMateApp/reports_student_responses.html', {
         'form': form,
         'student': student,
         'team_id': team_id,
         'teammates_data': teammates_data,
         'by_question_data': by_question_data,
-        'is_anonymous': is_anonymous,
-        'submission_date': responses.first().submitted_at
+        'is_anonymous': schema.is_anonymous,
+        'submission_date': responses[0].submitted_at
     })
 
 
@@ -551,53 +676,42 @@ def faculty_response_detail_view(request, form_id, response_id):
 
     form = get_object_or_404(FormTemplate.objects.select_related('created_by'), id=form_id, created_by=profile)
     response = get_object_or_404(
-        FormResponse.objects.select_related('submitted_by', 'submitted_by__user', 'form').prefetch_related('answers'),
+        FormResponse.objects.select_related('submitted_by', 'submitted_by__user', 'form'),
         id=response_id, 
         form=form
     )
     
-    # Mark as read
+    # Mark as read (conditional update so concurrent views only count it once)
     if not response.is_read:
+        stats.mark_read(form.id, FormResponse.objects.filter(id=response.id))
         response.is_read = True
-        response.save(update_fields=['is_read'])
     
-    # Parse form structure to get actual questions
+    # Questions from the compiled schema
     sections = form.structure.get('sections', []) if form.structure else []
+    schema = get_schema(form)
+    question_map = schema.question_map
     
-    # Create a mapping of question_id -> question data
-    question_map = {}
-    for section in sections:
-        for question in section.get('questions', []):
-            question_id = question.get('id')
-            if question_id:
-                # Store both with and without 'question_' prefix
-                question_map[str(question_id)] = question
-                question_map[f"question_{question_id}"] = question
+    # Form-wide score statistics for rating/slider questions (cached per form version)
+    question_stats = {q['id']: q for q in form_analytics(form)['questions']}
     
     # Build enriched answers list with full question data
-    answers = response.answers.all()
+    matrix = AnswerMatrix.for_responses([response])
     enriched_answers = []
-    for answer in answers:
-        question_id = answer.question
-        question_data = question_map.get(question_id, {})
+    for question_id, answer in matrix.answers_for(response.id):
+        question_key = normalize_question_key(question_id)
         enriched_answers.append({
             'question_id': question_id,
-            'question_data': question_data,
-            'answer': answer.answer,
-            'answer_obj': answer
+            'question_data': question_map.get(question_key, {}),
+            'answer': answer,
+            'stats': question_stats.get(question_key),
         })
     
-    # Check if anonymous evaluations are enabled
-    is_anonymous = False
-    if form.structure and 'settings' in form.structure:
-        is_anonymous = form.structure['settings'].get('anonymousEvaluations', False)
-    
     context = {
         'form': form,
         'response': response,
         'answers': enriched_answers,
         'sections': sections,
-        'is_anonymous': is_anonymous,
+        'is_anonymous': schema.is_anonymous,
     }
     
     return render(request, 'EvalMateApp/reports_response_detail.html', context)
@@ -612,62 +726,59 @@ def student_search_forms(request):
         return JsonResponse({'error': 'Access denied'}, status=403)
 
     q = request.GET.get('q', '').strip()
-    # EXCLUDE DRAFTS - only show published forms
-    qs = FormTemplate.objects.exclude(privacy='private')
-    results = []
+    try:
+        page = int(request.GET.get('page', 1))
+        page_size = int(request.GET.get('page_size', search.PAGE_SIZE))
+    except ValueError:
+        return JsonResponse({'error': 'Invalid page'}, status=400)
 
-    if q:
-        # search by course_id or title
-        qs = qs.filter(Q(course_id__icontains=q) | Q(title__icontains=q))
-    else:
-        qs = qs.none()
+    # Published forms of the student's institution, ranked and limited in SQL.
+    # Pages are cached per institution/department/query; is_pending is overlaid per student.
+    results, has_more = search.cached_search(profile, q, page, page_size)
 
-    # Get forms already in student's pending evaluations
     pending_form_ids = set(PendingEvaluation.objects.filter(
-        student=profile
-    ).values_list('form_id', flat=True))
-
-    # Filter by privacy rules (exclude drafts already done above)
-    visible = []
-    for f in qs:
-        # Same Institution: only check institution match
-        if f.privacy == 'institution' and f.institution and f.institution == profile.institution:
-            visible.append(f)
-        # Same Institution and Course: show forms from same institution but flag if department doesn't match
-        elif f.privacy == 'institution_course' and f.institution and f.institution == profile.institution:
-            # Show all forms in same institution, will check department match when accessing
-            visible.append(f)
-
-    for f in visible:
-        # Check if form is expired
-        is_expired = False
-        due_date_str = None
-        if f.due_date:
-            from django.utils import timezone
-            now = timezone.now()
-            due_date = f.due_date
-            if due_date.tzinfo is None:
-                due_date = timezone.make_aware(due_date)
-            is_expired = now > due_date
-            due_date_str = due_date.strftime("%B %d, %Y at %I:%M %p")
-        
-        # Check if department matches for institution_course privacy
-        department_mismatch = False
-        if f.privacy == 'institution_course':
-            if not (f.course_id and profile.department and f.course_id.lower() == profile.department.lower()):
-                department_mismatch = True
-        
+        student=profile, form_id__in=[r['id'] for r in results]
+    ).values_list('form_id', flat=True)) if results else set()
+    for result in results:
+        result['is_pending'] = result['id'] in pending_form_ids
+
+    return JsonResponse({
+        'results': results,
+        'page': max(1, page),
+        'has_more': has_more,
+    })
+
+
+@never_cache
+@login_required
+def student_autocomplete_forms(request):
+    """Search-as-you-type suggestions, matched in the in-process index instead of the database.
+
+    Pending status is left to the client, which already holds the student's
+    pending list.
+    """
+    profile = request.user.profile
+    if profile.account_type != 'student':
+        return JsonResponse({'error': 'Access denied'}, status=403)
+
+    q = request.GET.get('q', '').strip()
+    now = timezone.now()
+    results = []
+    for f in autocomplete.search(profile.institution, q):
+        due_date = timezone.localtime(f['due_at']) if f['due_at'] else None
+        department_mismatch = f['privacy'] == 'institution_course' and not (
+            f['course_id'] and profile.department and f['course_id'].lower() == profile.department.lower()
+        )
         results.append({
-            'id': f.id,
-            'title': f.title,
-            'course_id': f.course_id,
-            'created_at': f.created_at.isoformat(),
-            'requires_passcode': bool(f.passcode),
-            'is_pending': f.id in pending_form_ids,
-            'is_expired': is_expired,
-            'due_date_str': due_date_str,
+            'id': f['id'],
+            'title': f['title'],
+            'course_id': f['course_id'],
+            'created_at': f['created_at'].isoformat(),
+            'requires_passcode': bool(f['passcode']),
+            'is_expired': f['is_closed'] or (due_date is not None and now > due_date),
+            'due_date_str': due_date.strftime("%B %d, %Y at %I:%M %p") if due_date else None,
             'department_mismatch': department_mismatch,
-            'required_department': f.course_id if f.privacy == 'institution_course' else None,
+            'required_department': f['course_id'] if f['privacy'] == 'institution_course' else None,
         })
 
     return JsonResponse({'results': results})
@@ -688,17 +799,10 @@ def student_form_view(request, form_id):
         messages.error(request, 'This form is not published yet.')
         return redirect('student_dashboard')
     
-    # Check if form is past due date
-    if form.due_date:
-        from django.utils import timezone
-        now = timezone.now()
-        due_date = form.due_date
-        if due_date.tzinfo is None:
-            due_date = timezone.make_aware(due_date)
-        
-        if now > due_date:
-            messages.error(request, f'This form is closed. The deadline was {due_date.strftime("%B %d, %Y at %I:%M %p")}.')
-            return redirect('student_dashboard')
+    # Check if form is closed (deadline passed)
+    if form.is_past_due:
+        messages.error(request, f'This form is closed. The deadline was {form.due_date.strftime("%B %d, %Y at %I:%M %p")}.')
+        return redirect('student_dashboard')
 
     # Check privacy
     allowed = False
@@ -744,6 +848,8 @@ def student_form_view(request, form_id):
         student=profile,
         form=form
     )
+    if created:
+        pending_evaluations.pending_changed(profile)
     
     if created:
         messages.success(request, f'"{form.title}" has been added to your pending evaluations!')
@@ -775,17 +881,10 @@ def student_form_access(request, form_id):
         messages.error(request, 'This form is not available for your institution or course.')
         return redirect('student_dashboard')
     
-    # Check if form is past due date
-    if form.due_date:
-        from django.utils import timezone
-        now = timezone.now()
-        due_date = form.due_date
-        if due_date.tzinfo is None:
-            due_date = timezone.make_aware(due_date)
-        
-        if now > due_date:
-            messages.error(request, f'This form is closed. The deadline was {due_date.strftime("%B %d, %Y at %I:%M %p")}.')
-            return redirect('student_dashboard')
+    # Check if form is closed (deadline passed)
+    if form.is_past_due:
+        messages.error(request, f'This form is closed. The deadline was {form.due_date.strftime("%B %d, %Y at %I:%M %p")}.')
+        return redirect('student_dashboard')
     if request.method != 'POST':
         return redirect('student_form_view', form_id=form.id)
 
@@ -816,6 +915,8 @@ def student_form_access(request, form_id):
         student=profile,
         form=form
     )
+    if created:
+        pending_evaluations.pending_changed(profile)
     
     # Check if AJAX request
     if request.headers.get('X-Requested-With') == 'XMLHttpRequest' or request.content_type == 'application/json':
@@ -855,17 +956,10 @@ def student_form_submit(request, form_id):
         messages.error(request, 'This form is not available for your institution or course.')
         return redirect('student_dashboard')
     
-    # Check if form is past due date
-    if form.due_date:
-        from django.utils import timezone
-        now = timezone.now()
-        due_date = form.due_date
-        if due_date.tzinfo is None:
-            due_date = timezone.make_aware(due_date)
-        
-        if now > due_date:
-            messages.error(request, f'This form is closed. The deadline was {due_date.strftime("%B %d, %Y at %I:%M %p")}.')
-            return redirect('student_dashboard')
+    # Check if form is closed (deadline passed)
+    if form.is_past_due:
+        messages.error(request, f'This form is closed. The deadline was {form.due_date.strftime("%B %d, %Y at %I:%M %p")}.')
+        return redirect('student_dashboard')
     if request.method != 'POST':
         return redirect('student_form_view', form_id=form.id)
 
@@ -891,13 +985,14 @@ def student_form_submit(request, form_id):
         messages.error(request, 'Validation errors: ' + ' | '.join(validation_errors))
         return redirect('student_form_view', form_id=form.id)
     
-    # create response
-    fr = FormResponse.objects.create(form=form, submitted_by=profile)
-
+    # create response (a repeated submission token returns the stored one)
+    answers = {}
     for q in questions:
         qid = str(q.get('id') or q.get('label'))
-        answer = request.POST.get(qid, '')
-        ResponseAnswer.objects.create(response=fr, question=q.get('label', ''), answer=answer)
+        answers[q.get('label', '')] = request.POST.get(qid, '')
+    submissions.write_submission(
+        form, profile, [(None, answers)], token=request.POST.get('submission_token'),
+    )
 
     # Redirect to a success page instead of using messages
     return render(request, 'EvalMateApp/student_form_success.html', {'form': form})
@@ -979,11 +1074,16 @@ def api_publish_form(request):
                 form.structure = payload
                 form.privacy = privacy  # Publish the form
                 form.passcode = passcode or None
+                compile_form(form)
                 form.save()
+                # Structure may have changed - drop cached analytics
+                versions.bump('form', form.id)
+                autocomplete.forms_changed(form.institution)
+                conditional.user_changed(profile)
             except FormTemplate.DoesNotExist:
                 return JsonResponse({'error': 'Form not found'}, status=404)
         else:
-            form = FormTemplate.objects.create(
+            form = FormTemplate(
                 title=title,
                 description=description,
                 course_id=course_id,
@@ -993,6 +1093,10 @@ def api_publish_form(request):
                 privacy=privacy,  # Always publish
                 passcode=passcode or None,
             )
+            compile_form(form)
+            form.save()
+            autocomplete.forms_changed(form.institution)
+            conditional.user_changed(profile)
 
         return JsonResponse({'success': True, 'form_id': form.id})
     
@@ -1023,6 +1127,8 @@ def delete_form_api(request, form_id):
         
         # Delete the form (this will cascade delete responses and answers)
         form.delete()
+        autocomplete.forms_changed(form.institution)
+        conditional.user_changed(profile)
         
         return JsonResponse({'success': True})
     
@@ -1052,6 +1158,8 @@ def publish_form_api(request, form_id):
         if form.privacy == 'private':
             form.privacy = 'institution'
             form.save(update_fields=['privacy'])
+            autocomplete.forms_changed(form.institution)
+            conditional.user_changed(profile)
             return JsonResponse({'success': True, 'message': 'Form published successfully!'})
         else:
             return JsonResponse({'success': False, 'message': 'Form is already published'})
@@ -1082,6 +1190,8 @@ def unpublish_form_api(request, form_id):
         if form.privacy != 'private':
             form.privacy = 'private'
             form.save(update_fields=['privacy'])
+            autocomplete.forms_changed(form.institution)
+            conditional.user_changed(profile)
             return JsonResponse({'success': True, 'message': 'Form unpublished successfully'})
         else:
             return JsonResponse({'success': False, 'message': 'Form is already unpublished'})
@@ -1093,8 +1203,8 @@ def unpublish_form_api(request, form_id):
         return JsonResponse({'error': str(e)}, status=500)
 
 
-@never_cache
 @login_required
+@versioned_etag(conditional.form_keys)
 def api_load_form(request, form_id):
     """Load form data for editing"""
     if request.method != 'GET':
@@ -1121,8 +1231,8 @@ def api_load_form(request, form_id):
         return JsonResponse({'error': str(e)}, status=500)
 
 
-@never_cache
 @login_required
+@versioned_etag(conditional.form_keys)
 def get_form_details_api(request, form_id):
     """API endpoint to get form details"""
     if request.method != 'GET':
@@ -1181,18 +1291,10 @@ def student_eval_team_setup(request, form_id):
         messages.error(request, 'This form is not published yet.')
         return redirect('student_dashboard')
     
-    # Check if form is past due date
-    if form.due_date:
-        from django.utils import timezone
-        now = timezone.now()
-        # Ensure due_date is timezone aware
-        due_date = form.due_date
-        if due_date.tzinfo is None:
-            due_date = timezone.make_aware(due_date)
-        
-        if now > due_date:
-            messages.error(request, f'This form is closed. The deadline was {due_date.strftime("%B %d, %Y at %I:%M %p")}.')
-            return redirect('student_dashboard')
+    # Check if form is closed (deadline passed)
+    if form.is_past_due:
+        messages.error(request, f'This form is closed. The deadline was {form.due_date.strftime("%B %d, %Y at %I:%M %p")}.')
+        return redirect('student_dashboard')
 
     # Check privacy/accessibility
     allowed = False
@@ -1219,11 +1321,10 @@ def student_eval_team_setup(request, form_id):
     min_team_size = settings.get('minTeamSize', 2)
     max_team_size = settings.get('maxTeamSize', 10)
     
-    # Check if there's existing session data
-    eval_session_key = f'eval_{form_id}'
-    existing_session = request.session.get(eval_session_key, {})
+    # Check if there's an existing draft
+    draft = drafts.get_draft(profile, form, request.session)
 
-    # Handle POST - save team setup to session
+    # Handle POST - save team setup to the draft
     if request.method == 'POST':
         print(f"\n{'='*50}")
         print(f"=== FORM SUBMIT TRIGGERED ===")
@@ -1292,21 +1393,14 @@ def student_eval_team_setup(request, form_id):
             }
             return render(request, 'EvalMateApp/student_eval_team_setup.html', context)
         
-        # Store in session - preserve existing evaluations if any
-        request.session[eval_session_key] = {
-            'team_identifier': team_identifier,
-            'teammate_names': teammate_names,
-            'current_index': existing_session.get('current_index', 0),
-            'evaluations': existing_session.get('evaluations', []),
-        }
-        request.session.modified = True
+        # Store in the draft - preserve existing evaluations if any
+        draft = drafts.start_draft(profile, form, team_identifier, teammate_names)
         
         print(f"\n=== TEAM SETUP SAVED ===")
-        print(f"Session key: {eval_session_key}")
+        print(f"Draft: {draft.id}")
         print(f"Team: {team_identifier}")
         print(f"Teammates: {teammate_names}")
-        print(f"Current index: {request.session[eval_session_key]['current_index']}")
-        print(f"Existing evaluations: {len(request.session[eval_session_key]['evaluations'])}")
+        print(f"Current index: {draft.current_index}")
         print(f"Redirecting to: student_eval_evaluations with form_id={form.id}")
         print(f"{'='*50}\n")
         
@@ -1314,9 +1408,9 @@ def student_eval_team_setup(request, form_id):
         return redirect('student_eval_evaluations', form_id=form.id)
     
     # GET - show team setup form with settings
-    # Pre-fill with existing session data if available
+    # Pre-fill with existing draft data if available
     allow_self_eval = settings.get('allowSelfEvaluation', False)
-    existing_teammates = existing_session.get('teammate_names', [])
+    existing_teammates = draft.teammate_names if draft else []
     
     # If self-evaluation is enabled and teammates exist, filter out the first entry (self)
     display_teammates = existing_teammates.copy()
@@ -1327,7 +1421,7 @@ def student_eval_team_setup(request, form_id):
     context = {
         'form': form,
         'settings_json': json.dumps(settings),
-        'team_identifier': existing_session.get('team_identifier', ''),
+        'team_identifier': draft.team_identifier if draft else '',
         'teammate_names': json.dumps(display_teammates),  # Pass as JSON for JavaScript
         'student_name': f"{profile.first_name} {profile.last_name}" if profile.first_name else "You",
     }
@@ -1347,38 +1441,32 @@ def student_eval_evaluations(request, form_id):
 
     form = get_object_or_404(FormTemplate, id=form_id)
     
-    # Check if form is past due date
-    if form.due_date:
-        from django.utils import timezone
-        now = timezone.now()
-        due_date = form.due_date
-        if due_date.tzinfo is None:
-            due_date = timezone.make_aware(due_date)
-        
-        if now > due_date:
-            messages.error(request, f'This form is closed. The deadline was {due_date.strftime("%B %d, %Y at %I:%M %p")}.')
-            return redirect('student_dashboard')
+    # Check if form is closed (deadline passed)
+    if form.is_past_due:
+        messages.error(request, f'This form is closed. The deadline was {form.due_date.strftime("%B %d, %Y at %I:%M %p")}.')
+        return redirect('student_dashboard')
 
-    # Check session data
-    eval_session_key = f'eval_{form_id}'
-    eval_data = request.session.get(eval_session_key)
+    # Check draft data
+    draft = drafts.get_draft(profile, form, request.session)
     
-    print(f"Session key: {eval_session_key}")
-    print(f"Session data found: {eval_data is not None}")
+    print(f"Draft found: {draft is not None}")
     
-    if not eval_data:
-        print("ERROR: No session data, redirecting to team setup")
+    if not draft:
+        print("ERROR: No draft, redirecting to team setup")
         messages.error(request, 'Please complete team setup first.')
         return redirect('student_eval_team_setup', form_id=form.id)
     
-    print(f"Team: {eval_data.get('team_identifier')}")
-    print(f"Teammates: {eval_data.get('teammate_names')}")
-    print(f"Current index: {eval_data.get('current_index')}")
-    print(f"Evaluations completed: {len(eval_data.get('evaluations', []))}")
+    teammate_names = draft.teammate_names
+    current_index = draft.current_index
+    evaluations = draft.evaluations()
     
-    teammate_names = eval_data.get('teammate_names', [])
-    current_index = eval_data.get('current_index', 0)
-    evaluations = eval_data.get('evaluations', [])
+    print(f"Team: {draft.team_identifier}")
+    print(f"Teammates: {teammate_names}")
+    print(f"Current index: {current_index}")
+    print(f"Evaluations completed: {len(evaluations)}")
+    
+    # Idempotency token for the final submit, stable for this draft
+    submission_token = drafts.ensure_token(draft)
     
     # Check if all teammates are completed
     completed_teammate_names = [e.get('teammate') for e in evaluations]
@@ -1390,17 +1478,13 @@ def student_eval_evaluations(request, form_id):
             messages.info(request, 'All teammates have been evaluated. You can edit any evaluation or submit.')
             # Set to first teammate for review
             current_index = 0
-            eval_data['current_index'] = 0
-            request.session[eval_session_key] = eval_data
-            request.session.modified = True
+            drafts.set_index(draft, 0)
         else:
             # Find first unevaluated teammate
             for i, name in enumerate(teammate_names):
                 if name not in completed_teammate_names:
                     current_index = i
-                    eval_data['current_index'] = i
-                    request.session[eval_session_key] = eval_data
-                    request.session.modified = True
+                    drafts.set_index(draft, i)
                     break
     
     # Prepare context
@@ -1446,12 +1530,16 @@ def student_eval_evaluations(request, form_id):
         'current_index': current_index,
         'current_teammate': current_teammate,
         'completed_teammates': completed_teammates,
-        'team_identifier': eval_data.get('team_identifier'),
+        'team_identifier': draft.team_identifier,
         'evaluations': evaluations,  # Pass all evaluations for navigation
         'current_answers': current_teammate_answers,  # Pre-fill answers if editing
         'is_editing_existing': is_editing_existing,  # Flag to show if editing
         'completed_count': completed_count,  # Actual number of completed evaluations
         'allow_self_evaluation': allow_self_eval,  # Pass to template
+        'submission_token': submission_token,
+        # The page steps through teammates in the browser and posts the whole team once
+        'saved_answers': {e.get('teammate'): e.get('answers', {}) for e in evaluations},
+        'batch_submit_url': reverse('api_submit_team_evaluation', args=[form.id]),
     }
     
     return render(request, 'EvalMateApp/student_eval_evaluations.html', context)
@@ -1477,35 +1565,34 @@ def student_eval_submit_evaluation(request, form_id):
         return HttpResponseForbidden('Access denied')
 
     form = get_object_or_404(FormTemplate, id=form_id)
+    schema = get_schema(form)
     
-    # Check if form is past due date
-    if form.due_date:
-        from django.utils import timezone
-        now = timezone.now()
-        due_date = form.due_date
-        if due_date.tzinfo is None:
-            due_date = timezone.make_aware(due_date)
-        
-        if now > due_date:
-            messages.error(request, f'This form is closed. The deadline was {due_date.strftime("%B %d, %Y at %I:%M %p")}.')
-            return redirect('student_dashboard')
+    # Check if form is closed (deadline passed)
+    if form.is_past_due:
+        messages.error(request, f'This form is closed. The deadline was {form.due_date.strftime("%B %d, %Y at %I:%M %p")}.')
+        return redirect('student_dashboard')
 
-    # Get session data
-    eval_session_key = f'eval_{form_id}'
-    eval_data = request.session.get(eval_session_key)
+    # A retry or double-click of an already stored final submission
+    submission_token = request.POST.get('submission_token')
+    if submissions.already_submitted(profile, submission_token):
+        print("Submission token already used - not saving again")
+        messages.success(request, f'✅ Your evaluations for "{form.title}" were already submitted.')
+        return redirect('student_dashboard')
     
-    print(f"Session key: {eval_session_key}")
-    print(f"Session data exists: {eval_data is not None}")
+    # Get draft data
+    draft = drafts.get_draft(profile, form, request.session)
     
-    if not eval_data:
-        print("ERROR: No session data found!")
+    print(f"Draft exists: {draft is not None}")
+    
+    if not draft:
+        print("ERROR: No draft found!")
         messages.error(request, 'Session expired. Please start over.')
         return redirect('student_eval_team_setup', form_id=form.id)
     
-    teammate_names = eval_data.get('teammate_names', [])
-    current_index = eval_data.get('current_index', 0)
-    evaluations = eval_data.get('evaluations', [])
-    team_identifier = eval_data.get('team_identifier', 'Unknown Team')
+    teammate_names = draft.teammate_names
+    current_index = draft.current_index
+    evaluations = draft.evaluations()
+    team_identifier = draft.team_identifier or 'Unknown Team'
     
     if current_index >= len(teammate_names):
         messages.error(request, 'Invalid evaluation state.')
@@ -1531,24 +1618,8 @@ def student_eval_submit_evaluation(request, form_id):
         if isinstance(value, list):
             answers[key] = ', '.join(value)
     
-    # Validate character limits for text responses
-    form_structure = form.structure if isinstance(form.structure, dict) else {}
-    sections = form_structure.get('sections', [])
-    validation_errors = []
-    
-    for section in sections:
-        for question in section.get('questions', []):
-            if question.get('type') == 'text':
-                question_key = f"question_{question.get('id')}"
-                answer_text = answers.get(question_key, '')
-                character_limit = question.get('options', {}).get('characterLimit', 500)
-                
-                if len(answer_text) > character_limit:
-                    question_text = question.get('text', 'Question')
-                    validation_errors.append(
-                        f"{question_text}: Response exceeds {character_limit} character limit "
-                        f"(current: {len(answer_text)} characters)"
-                    )
+    # Validate character limits and score ranges against the compiled schema
+    validation_errors = schema.validate_answers(answers)
     
     if validation_errors:
         messages.error(request, 'Validation errors: ' + ' | '.join(validation_errors))
@@ -1560,14 +1631,11 @@ def student_eval_submit_evaluation(request, form_id):
     # Remove existing evaluation for this teammate if editing
     evaluations = [e for e in evaluations if e.get('teammate') != current_teammate]
     
-    # Store evaluation in session
     evaluations.append({
         'teammate': current_teammate,
         'answers': answers,
     })
     
-    eval_data['evaluations'] = evaluations
-    
     # Check if all teammates evaluated NOW (before updating index)
     completed_teammate_names = [e.get('teammate') for e in evaluations]
     all_completed = len(completed_teammate_names) >= len(teammate_names)
@@ -1575,11 +1643,8 @@ def student_eval_submit_evaluation(request, form_id):
     print(f"Completion check: {len(completed_teammate_names)}/{len(teammate_names)} teammates evaluated")
     print(f"All completed: {all_completed}")
     
-    # Update session with new evaluations data
-    request.session[eval_session_key] = eval_data
-    request.session.modified = True
-    
-    # Only update index and save draft if NOT all completed yet
+    # Only move the index if NOT all completed yet
+    next_index = None
     if not all_completed:
         # Only increment index if this was a new evaluation (not editing)
         # If editing, find the next unevaluated teammate
@@ -1590,74 +1655,59 @@ def student_eval_submit_evaluation(request, form_id):
                 if name not in completed_teammate_names:
                     next_index = i
                     break
-            eval_data['current_index'] = next_index
             print(f"Editing mode: Moving to next unevaluated teammate at index {next_index}")
         else:
             # New evaluation: move to next teammate
-            eval_data['current_index'] = current_index + 1
-            print(f"New evaluation: Moving to index {current_index + 1}")
-        
-        # Update session again with new index
-        request.session[eval_session_key] = eval_data
-        request.session.modified = True
+            next_index = current_index + 1
+            print(f"New evaluation: Moving to index {next_index}")
         
         print(f"Evaluation saved for {current_teammate}, moving to next")
     else:
         print(f"All teammates completed! Proceeding to final submission...")
     
+    # Store this teammate's answers in the draft (one row) and move the index
+    drafts.save_answers(draft, current_teammate, answers, next_index)
+    
     # Check if all teammates evaluated
     if all_completed:
         # All done - save to database
         print(f"!!! ENTERING DATABASE SAVE BLOCK - all_completed is True !!!")
+        from django.conf import settings as django_settings
         from django.db import transaction
         
         try:
             with transaction.atomic():
                 # Create FormResponse for the team
-                team_identifier = eval_data.get('team_identifier', 'Unknown Team')
-                
                 print(f"=== SAVING EVALUATIONS ===")
                 print(f"Student: {profile.user.username}")
                 print(f"Form: {form.title} (ID: {form.id})")
                 print(f"Team: {team_identifier}")
                 print(f"Number of evaluations: {len(evaluations)}")
                 
-                # Create a response for each teammate evaluation
-                for idx, evaluation in enumerate(evaluations):
-                    teammate_name = evaluation.get('teammate')
-                    answers_dict = evaluation.get('answers', {})
-                    
-                    print(f"Creating response {idx + 1}/{len(evaluations)} for teammate: {teammate_name}")
-                    
-                    # Create FormResponse
-                    form_response = FormResponse.objects.create(
-                        form=form,
-                        submitted_by=profile,
-                        team_identifier=team_identifier,
-                        teammate_name=teammate_name,
+                entries = [(e.get('teammate'), e.get('answers', {})) for e in evaluations]
+                if django_settings.SUBMISSION_QUEUE_ENABLED:
+                    # Stored later by manage.py drain_submission_queue
+                    queued = submissions.enqueue_submission(
+                        form, profile, entries, team_identifier=team_identifier, token=submission_token,
                     )
-                    
-                    print(f"FormResponse created with ID: {form_response.id}")
-                    
-                    # Create ResponseAnswer for each question
-                    answer_count = 0
-                    for question_key, answer_value in answers_dict.items():
-                        ResponseAnswer.objects.create(
-                            response=form_response,
-                            question=question_key,
-                            answer=answer_value,
-                        )
-                        answer_count += 1
-                    
-                    print(f"Created {answer_count} answers for this response")
+                    print(f"Submission queued: {queued}")
+                else:
+                    # One response per teammate, written with two bulk INSERTs
+                    created_response_ids, created = submissions.write_submission(
+                        form, profile, entries, team_identifier=team_identifier, token=submission_token,
+                    )
+                    if created:
+                        print(f"FormResponses created with IDs: {created_response_ids}")
+                    else:
+                        print(f"Duplicate submission token, keeping responses {created_response_ids}")
                 
-                # Clear session
-                del request.session[eval_session_key]
-                request.session.modified = True
-                print("Session cleared")
+                # Clear the draft
+                drafts.discard(draft)
+                print("Draft cleared")
                 
                 # Remove from pending evaluations
                 deleted_count = PendingEvaluation.objects.filter(student=profile, form=form).delete()
+                pending_evaluations.pending_changed(profile)
                 print(f"Removed from pending evaluations: {deleted_count[0]} records deleted")
                 
                 print("=== SUBMISSION COMPLETE ===")
@@ -1678,10 +1728,149 @@ def student_eval_submit_evaluation(request, form_id):
     return redirect('student_eval_evaluations', form_id=form.id)
 
 
+@never_cache
+@login_required
+def api_submit_team_evaluation(request, form_id):
+    """Validate and store every teammate's evaluation from one JSON request.
+
+    Body: {"team_identifier": "...", "submission_token": "...",
+           "evaluations": [{"teammate": "...", "answers": {"<question id>": ...}}]}
+    """
+    if request.method != 'POST':
+        return JsonResponse({'error': 'POST required'}, status=400)
+
+    profile = request.user.profile
+    if profile.account_type != 'student':
+        return JsonResponse({'error': 'Access denied'}, status=403)
+
+    form = get_object_or_404(FormTemplate, id=form_id)
+    schema = get_schema(form)
+
+    if form.privacy == 'private':
+        return JsonResponse({'error': 'This form is not published yet.'}, status=403)
+
+    allowed = False
+    if form.privacy == 'institution' and form.institution == profile.institution:
+        allowed = True
+    elif form.privacy == 'institution_course' and form.institution == profile.institution:
+        if form.course_id and profile.department and form.course_id.lower() == profile.department.lower():
+            allowed = True
+    if not allowed:
+        return JsonResponse({'error': 'This form is not available for your institution or course.'}, status=403)
+
+    if form.passcode and form.id not in request.session.get('verified_forms', []):
+        return JsonResponse({'error': 'Please enter the form passcode first.'}, status=403)
+
+    if form.is_past_due:
+        return JsonResponse({
+            'error': f'This form is closed. The deadline was {form.due_date.strftime("%B %d, %Y at %I:%M %p")}.'
+        }, status=403)
+
+    try:
+        payload = json.loads(request.body.decode('utf-8'))
+    except Exception as e:
+        return JsonResponse({'error': f'Invalid JSON: {str(e)}'}, status=400)
+    if not isinstance(payload, dict):
+        return JsonResponse({'error': 'Invalid JSON: object expected'}, status=400)
+
+    # A retry or double-click of an already stored submission
+    submission_token = payload.get('submission_token')
+    if not isinstance(submission_token, str):
+        submission_token = None
+    if submissions.already_submitted(profile, submission_token):
+        receipt = submissions.find_receipt(profile, submission_token)
+        messages.success(request, f'✅ Your evaluations for "{form.title}" were already submitted.')
+        return JsonResponse({
+            'success': True,
+            'duplicate': True,
+            'response_ids': receipt.response_ids if receipt else [],
+            'redirect_url': reverse('student_dashboard'),
+        })
+
+    team_identifier = str(payload.get('team_identifier') or '').strip()
+    if not team_identifier:
+        return JsonResponse({'error': 'Team identifier is required.'}, status=400)
+
+    evaluations = payload.get('evaluations')
+    if not isinstance(evaluations, list) or not evaluations:
+        return JsonResponse({'error': 'At least one evaluation is required.'}, status=400)
+
+    # Validate the whole team before writing anything
+    errors = []
+    entries = []
+    seen = set()
+    for evaluation in evaluations:
+        if not isinstance(evaluation, dict):
+            errors.append('Each evaluation must be an object.')
+            continue
+        teammate = str(evaluation.get('teammate') or '').strip()
+        answers = evaluation.get('answers')
+        if not teammate:
+            errors.append('Teammate name is required.')
+            continue
+        if teammate.casefold() in seen:
+            errors.append(f'{teammate}: Teammate listed more than once.')
+            continue
+        seen.add(teammate.casefold())
+        if not isinstance(answers, dict):
+            errors.append(f'{teammate}: Answers must be an object.')
+            continue
+        answers = schema.clean_answers(answers)
+        errors.extend(f'{teammate}: {error}' for error in schema.validate_answers(answers))
+        entries.append((teammate, answers))
+
+    if not errors:
+        who = 'total members (including yourself)' if schema.allow_self_evaluation else 'teammates'
+        if len(entries) < schema.min_team_size:
+            errors.append(f'At least {schema.min_team_size} {who} are required.')
+        elif len(entries) > schema.max_team_size:
+            errors.append(f'Maximum {schema.max_team_size} {who} allowed.')
+
+    if errors:
+        return JsonResponse({'error': 'Validation errors', 'errors': errors}, status=400)
+
+    try:
+        from django.conf import settings as django_settings
+        from django.db import transaction
+
+        with transaction.atomic():
+            if django_settings.SUBMISSION_QUEUE_ENABLED:
+                # Stored later by manage.py drain_submission_queue
+                submissions.enqueue_submission(
+                    form, profile, entries, team_identifier=team_identifier, token=submission_token,
+                )
+                response_ids, created = [], True
+            else:
+                response_ids, created = submissions.write_submission(
+                    form, profile, entries, team_identifier=team_identifier, token=submission_token,
+                )
+
+            # The team was submitted in one go, so any half-finished draft is obsolete
+            draft = drafts.get_draft(profile, form)
+            if draft:
+                drafts.discard(draft)
+            PendingEvaluation.objects.filter(student=profile, form=form).delete()
+            pending_evaluations.pending_changed(profile)
+
+        print(f"Batch submission for form {form.id} by {profile.user.username}: {len(entries)} teammates")
+        messages.success(request, f'✅ All evaluations submitted successfully! You evaluated {len(entries)} teammates for "{form.title}".')
+        return JsonResponse({
+            'success': True,
+            'duplicate': not created,
+            'queued': django_settings.SUBMISSION_QUEUE_ENABLED,
+            'response_ids': response_ids,
+            'redirect_url': reverse('student_dashboard'),
+        })
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        return JsonResponse({'error': str(e)}, status=500)
+
+
 # ==================== PENDING EVALUATIONS API ====================
 
-@never_cache
 @login_required
+@versioned_etag(pending_evaluations.etag_keys)
 def api_get_pending_evaluations(request):
     """Get list of pending evaluations for student or add new form to pending"""
     try:
@@ -1723,78 +1912,13 @@ def api_get_pending_evaluations(request):
             )
             
             if created:
+                pending_evaluations.pending_changed(profile)
                 return JsonResponse({'success': True, 'message': f'"{form.title}" has been added to your pending evaluations!'})
             else:
                 return JsonResponse({'success': True, 'message': f'"{form.title}" is already in your pending evaluations.'})
         
-        # Handle GET request to list pending evaluations
-        from datetime import datetime, timezone
-        
-        pending = PendingEvaluation.objects.filter(student=profile).select_related('form', 'form__created_by')
-        
-        evaluations_list = []
-        for p in pending:
-            # Calculate days left
-            days_left = None
-            is_expired = False
-            due_date = p.form.due_date
-            if due_date:
-                # Use local timezone instead of UTC
-                from django.utils import timezone as dj_tz
-                now = dj_tz.now()  # This uses Django's configured timezone
-                
-                # Ensure due_date is timezone aware
-                if due_date.tzinfo is None:
-                    due_date = dj_tz.make_aware(due_date)
-                
-                # Debug logging
-                print(f"Form '{p.form.title}' - Due: {due_date}, Now: {now}, Expired: {now > due_date}")
-                
-                delta = due_date - now
-                days_left = delta.days
-                
-                # Check if expired (past due date and time)
-                if now > due_date:
-                    is_expired = True
-                    days_left = 0
-                else:
-                    days_left = max(0, days_left)
-            
-            # Get team settings from form structure
-            settings = p.form.structure.get('settings', {}) if isinstance(p.form.structure, dict) else {}
-            min_team_size = settings.get('minTeamSize', 'N/A')
-            max_team_size = settings.get('maxTeamSize', 'N/A')
-            allow_self_eval = settings.get('allowSelfEvaluation', False)
-            
-            # Determine status
-            if is_expired:
-                status = 'expired'
-            elif days_left is not None and days_left <= 3:
-                status = 'urgent'
-            else:
-                status = 'not_started'
-            
-            has_draft = False
-            
-            evaluations_list.append({
-                'id': p.id,
-                'form_id': p.form.id,
-                'title': p.form.title,
-                'description': p.form.description,
-                'course': p.form.course_id,
-                'created_by': p.form.created_by.user.username if p.form.created_by else 'Unknown',
-                'added_at': p.added_at.isoformat(),
-                'days_left': days_left,
-                'due_date': due_date.isoformat() if due_date else None,
-                'status': status,
-                'has_draft': has_draft,
-                'is_expired': is_expired,
-                'team_settings': {
-                    'min_team_size': min_team_size,
-                    'max_team_size': max_team_size,
-                    'allow_self_evaluation': allow_self_eval
-                }
-            })
+        # Handle GET request to list pending evaluations (one projected query, cached per student)
+        evaluations_list = pending_evaluations.student_pending(profile)
         
         return JsonResponse({'pending_evaluations': evaluations_list})
     except Exception as e:
@@ -1818,51 +1942,35 @@ def api_remove_pending_evaluation(request, pending_id):
         
         pending = get_object_or_404(PendingEvaluation, id=pending_id, student=profile)
         pending.delete()
+        pending_evaluations.pending_changed(profile)
         
         return JsonResponse({'success': True, 'message': 'Removed from pending evaluations'})
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
 
-@never_cache
 @login_required
+@versioned_etag(conditional.institution_keys)
 def api_get_evaluation_history(request):
-    """Get list of completed evaluations for student"""
+    """Get completed evaluations for student, one per form and team, a page at a time"""
     try:
         profile = request.user.profile
         if profile.account_type != 'student':
             return JsonResponse({'error': 'Access denied'}, status=403)
         
-        # Get all responses submitted by this student
-        responses = FormResponse.objects.filter(submitted_by=profile).select_related('form').order_by('-submitted_at')
+        cursor = request.GET.get('cursor')
+        if cursor:
+            history_list, next_cursor = evaluation_history.history_page(profile, cursor)
+            return JsonResponse({'history': history_list, 'next_cursor': next_cursor, 'has_more': next_cursor is not None})
         
-        # Group by form to show unique forms (not individual teammate responses)
-        seen_forms = set()
-        history_list = []
-        
-        for response in responses:
-            if response.form.id not in seen_forms:
-                seen_forms.add(response.form.id)
-                
-                # Count how many teammates evaluated for this form
-                teammate_count = FormResponse.objects.filter(
-                    form=response.form,
-                    submitted_by=profile,
-                    team_identifier=response.team_identifier
-                ).count()
-                
-                history_list.append({
-                    'response_id': response.id,
-                    'form_id': response.form.id,
-                    'title': response.form.title,
-                    'course': response.form.course_id,
-                    'description': response.form.description,
-                    'submitted_at': response.submitted_at.isoformat(),
-                    'team_identifier': response.team_identifier or 'N/A',
-                    'teammates_evaluated': teammate_count,
-                })
-        
-        return JsonResponse({'history': history_list})
+        # First page with the total and any queued submissions (cached per student)
+        summary = evaluation_history.student_summary(profile)
+        return JsonResponse({
+            'history': summary['history'],
+            'total': summary['total'],
+            'next_cursor': summary['next_cursor'],
+            'has_more': summary['next_cursor'] is not None,
+        })
     except Exception as e:
         import traceback
         print(traceback.format_exc())
@@ -1878,72 +1986,12 @@ def api_get_evaluation_detail(request, response_id):
         if profile.account_type != 'student':
             return JsonResponse({'error': 'Access denied'}, status=403)
         
-        # Get all responses for this form and team
-        first_response = FormResponse.objects.filter(
-            id=response_id,
-            submitted_by=profile
-        ).select_related('form').first()
-        
-        if not first_response:
+        # Submitted evaluations don't change: served from cache after the first view
+        payload = evaluation_history.evaluation_detail(profile, response_id)
+        if payload is None:
             return JsonResponse({'error': 'Evaluation not found'}, status=404)
         
-        # Get all responses for this form and team identifier
-        all_responses = FormResponse.objects.filter(
-            form=first_response.form,
-            submitted_by=profile,
-            team_identifier=first_response.team_identifier
-        ).prefetch_related('answers').order_by('teammate_name')
-        
-        # Build question map from form structure
-        form = first_response.form
-        sections = form.structure.get('sections', []) if form.structure else []
-        question_map = {}
-        
-        for section in sections:
-            for question in section.get('questions', []):
-                question_id = question.get('id')
-                if question_id:
-                    question_map[str(question_id)] = question
-                    question_map[f"question_{question_id}"] = question
-        
-        # Build response data
-        teammates_data = []
-        for resp in all_responses:
-            answers_data = []
-            for answer in resp.answers.all():
-                question_id = answer.question
-                question_data = question_map.get(question_id, {})
-                
-                # Get question options if available
-                options_data = question_data.get('options', {})
-                options_list = options_data.get('options', []) if isinstance(options_data, dict) else []
-                labels_list = options_data.get('labels', ['Min', 'Max']) if isinstance(options_data, dict) else ['Min', 'Max']
-                max_value = options_data.get('max', 100) if isinstance(options_data, dict) else 100
-                
-                answers_data.append({
-                    'question_id': question_id,
-                    'question_text': question_data.get('text', 'Question not found'),
-                    'question_type': question_data.get('type', 'text'),
-                    'answer': answer.answer,
-                    'options': options_list,
-                    'labels': labels_list,
-                    'max': max_value
-                })
-            
-            teammates_data.append({
-                'teammate_name': resp.teammate_name or 'Unknown',
-                'submitted_at': resp.submitted_at.isoformat(),
-                'answers': answers_data
-            })
-        
-        return JsonResponse({
-            'form_title': first_response.form.title,
-            'course': first_response.form.course_id,
-            'description': first_response.form.description,
-            'team_identifier': first_response.team_identifier or 'N/A',
-            'teammates': teammates_data,
-            'total_teammates': len(teammates_data)
-        })
+        return JsonResponse(payload)
     
     except Exception as e:
         import traceback
@@ -1961,27 +2009,19 @@ def student_eval_navigate_teammate(request, form_id, teammate_index):
 
     form = get_object_or_404(FormTemplate, id=form_id)
     
-    # Check if form is past due date
-    if form.due_date:
-        from django.utils import timezone
-        now = timezone.now()
-        due_date = form.due_date
-        if due_date.tzinfo is None:
-            due_date = timezone.make_aware(due_date)
-        
-        if now > due_date:
-            messages.error(request, f'This form is closed. The deadline was {due_date.strftime("%B %d, %Y at %I:%M %p")}.')
-            return redirect('student_dashboard')
+    # Check if form is closed (deadline passed)
+    if form.is_past_due:
+        messages.error(request, f'This form is closed. The deadline was {form.due_date.strftime("%B %d, %Y at %I:%M %p")}.')
+        return redirect('student_dashboard')
 
-    # Get session data
-    eval_session_key = f'eval_{form_id}'
-    eval_data = request.session.get(eval_session_key)
+    # Get draft data
+    draft = drafts.get_draft(profile, form, request.session)
     
-    if not eval_data:
+    if not draft:
         messages.error(request, 'Session expired. Please start over.')
         return redirect('student_eval_team_setup', form_id=form.id)
     
-    teammate_names = eval_data.get('teammate_names', [])
+    teammate_names = draft.teammate_names
     
     # Validate index
     if teammate_index < 0 or teammate_index >= len(teammate_names):
@@ -1989,9 +2029,7 @@ def student_eval_navigate_teammate(request, form_id, teammate_index):
         return redirect('student_eval_evaluations', form_id=form.id)
     
     # Update current index
-    eval_data['current_index'] = teammate_index
-    request.session[eval_session_key] = eval_data
-    request.session.modified = True
+    drafts.set_index(draft, teammate_index)
     
     print(f"Navigating to teammate index {teammate_index}")
     
@@ -2030,6 +2068,7 @@ def api_upload_profile_picture(request):
         # Save locally first (for backward compatibility)
         profile.profile_picture = uploaded_file
         profile.save()
+        conditional.user_changed(profile)
         local_url = profile.profile_picture.url if profile.profile_picture else ''
         print(f"[DEBUG] Local profile picture saved: {local_url}")
 
@@ -2066,6 +2105,7 @@ def api_upload_profile_picture(request):
                 # Save URL on profile for server-rendered pages
                 profile.profile_picture_url = public_url
                 profile.save(update_fields=['profile_picture_url'])
+                conditional.user_changed(profile)
                 print(f"[DEBUG] Supabase upload successful: {public_url}")
         except Exception as supa_err:
             print(f"[WARN] Supabase upload failed: {supa_err}")
@@ -2109,6 +2149,7 @@ def api_update_personal_info(request):
             profile.date_of_birth = None
 
         profile.save(update_fields=['phone_number', 'date_of_birth'])
+        conditional.user_changed(profile)
 
         return JsonResponse({'success': True})
     except Exception as e:
@@ -2239,6 +2280,7 @@ def api_update_academic_info(request):
         # Persist only updated fields
         update_fields = ['academic_year'] if is_faculty else ['department', 'academic_year']
         profile.save(update_fields=update_fields)
+        conditional.user_changed(profile)
         
         # If department changed (students only), remove pending evaluations that require same department
         removed_forms = []
@@ -2258,6 +2300,8 @@ def api_update_academic_info(request):
                             'course_id': form.course_id
                         })
                         pending.delete()
+            if removed_forms:
+                pending_evaluations.pending_changed(profile)
 
         # Return normalized values so UI can reflect exactly what was saved
         result = {
@@ -2276,8 +2320,8 @@ def api_update_academic_info(request):
 
 # ==================== SPA API ENDPOINTS ====================
 
-@never_cache
 @login_required
+@versioned_etag(conditional.institution_keys)
 def api_faculty_overview_content(request):
     """API endpoint for SPA - returns only the content HTML for overview page"""
     try:
@@ -2287,13 +2331,8 @@ def api_faculty_overview_content(request):
         
         from django.db.models import Count
         
-        # Get recent submissions - one per student (not per teammate rated)
-        recent_submissions = FormResponse.objects.filter(
-            form__created_by=profile,
-            submitted_by__isnull=False
-        ).select_related(
-            'form', 'submitted_by'
-        ).order_by('submitted_by', '-submitted_at').distinct('submitted_by')[:3]
+        # Latest submissions of the most recent submitters, from the capped activity feed
+        recent_activity = activity.recent_activity(profile)
         
         # Get all forms
         forms = FormTemplate.objects.filter(
@@ -2311,7 +2350,7 @@ def api_faculty_overview_content(request):
         context = {
             'user': request.user,
             'profile': profile,
-            'recent_submissions': recent_submissions,
+            'recent_activity': recent_activity,
             'forms': forms_list,
             'total_forms': total_forms,
             'published_forms': published_forms,
@@ -2333,8 +2372,8 @@ def api_faculty_overview_content(request):
         return JsonResponse({'error': str(e)}, status=500)
 
 
-@never_cache
 @login_required
+@versioned_etag(conditional.profile_keys)
 def api_faculty_form_builder_content(request):
     """API endpoint for SPA - returns only the content HTML for form builder page"""
     try:
@@ -2364,8 +2403,8 @@ def api_faculty_form_builder_content(request):
         return JsonResponse({'error': str(e)}, status=500)
 
 
-@never_cache
 @login_required
+@versioned_etag(conditional.profile_keys)
 def api_faculty_profile_content(request):
     """API endpoint for SPA - returns only the content HTML for profile page"""
     try:
@@ -2390,8 +2429,8 @@ def api_faculty_profile_content(request):
         return HttpResponse('<div style="text-align: center; padding: 3rem;"><p>Error loading profile</p></div>', status=500)
 
 
-@never_cache
 @login_required
+@versioned_etag(conditional.institution_keys)
 def api_faculty_reports_content(request):
     """API endpoint for SPA - returns only the content HTML for reports page"""
     try:
@@ -2399,37 +2438,16 @@ def api_faculty_reports_content(request):
         if profile.account_type != 'faculty':
             return JsonResponse({'error': 'Access denied'}, status=403)
         
-        from django.db.models import Count
-        today = timezone.localdate()
-        
-        # Get forms with responses
-        forms = FormTemplate.objects.filter(
-            created_by=profile
-        ).prefetch_related('responses').order_by('-created_at')
-        
-        forms_data = []
-        for f in forms:
-            responses = f.responses.only('id', 'submitted_by_id', 'team_identifier', 'submitted_at', 'is_read').all()
-            unique_students = set()
-            unique_today = set()
-            has_unread = False
-            
-            for r in responses:
-                student_key = (r.submitted_by_id, r.team_identifier)
-                unique_students.add(student_key)
-                
-                if r.submitted_at.date() == today:
-                    unique_today.add(student_key)
-                
-                if not r.is_read:
-                    has_unread = True
-            
-            forms_data.append({
+        # Counts come from the maintained rollups, so this is a single query
+        forms_data = [
+            {
                 'form': f,
-                'total_submissions': len(unique_students),
-                'todays_submissions': len(unique_today),
-                'unread_submissions': 1 if has_unread else 0,
-            })
+                'total_submissions': f.total_submissions,
+                'todays_submissions': f.todays_submissions,
+                'unread_submissions': f.unread_submissions,
+            }
+            for f in stats.forms_with_stats(profile)
+        ]
         
         context = {
             'forms_data': forms_data,
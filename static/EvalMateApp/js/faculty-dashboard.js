@@ -163,6 +163,43 @@ function initRecentActivities() {
     
     // Setup activity card interactions
     setupActivityCardListeners();
+    
+    // The overview may come from a revalidated (304) response, so relative times are computed here
+    refreshActivityTimes();
+    clearInterval(window.activityTimesInterval);
+    window.activityTimesInterval = setInterval(refreshActivityTimes, 60 * 1000);
+}
+
+/**
+ * "5 minutes" / "2 hours, 3 minutes" like Django's timesince filter
+ */
+function formatTimeSince(date) {
+    const units = [
+        ['year', 365 * 24 * 3600], ['month', 30 * 24 * 3600], ['week', 7 * 24 * 3600],
+        ['day', 24 * 3600], ['hour', 3600], ['minute', 60]
+    ];
+    const seconds = Math.max(0, Math.floor((Date.now() - date.getTime()) / 1000));
+    const plural = (count, name) => `${count} ${name}${count === 1 ? '' : 's'}`;
+    
+    const index = units.findIndex(([, size]) => seconds >= size);
+    if (index === -1) return plural(0, 'minute');
+    
+    const [name, size] = units[index];
+    const count = Math.floor(seconds / size);
+    let text = plural(count, name);
+    if (index + 1 < units.length) {
+        const [nextName, nextSize] = units[index + 1];
+        const nextCount = Math.floor((seconds - count * size) / nextSize);
+        if (nextCount > 0) text += `, ${plural(nextCount, nextName)}`;
+    }
+    return text;
+}
+
+function refreshActivityTimes() {
+    document.querySelectorAll('.activity-card__time[data-timestamp]').forEach(element => {
+        const date = new Date(element.dataset.timestamp);
+        if (!isNaN(date)) element.textContent = `${formatTimeSince(date)} ago`;
+    });
 }
 
 /**
@@ -145,9 +145,10 @@ async function loadStats() {
         
         const pendingData = await pendingResponse.json();
         const historyData = await historyResponse.json();
+        rememberPendingForms(pendingData.pending_evaluations);
         
         const pendingCount = pendingData.pending_evaluations.length;
-        const completedCount = historyData.history.length;
+        const completedCount = historyData.total ?? historyData.history.length;
         const totalCount = pendingCount + completedCount;
         const completionRate = totalCount > 0 ? Math.round((completedCount / totalCount) * 100) : 0;
         
@@ -304,6 +305,7 @@ async function fetchPendingEvaluations(filter = 'all') {
         
         const data = await response.json();
         allEvaluations = data.pending_evaluations || [];
+        rememberPendingForms(allEvaluations);
         
         // Apply filter and render
         requestAnimationFrame(() => {
@@ -603,6 +605,9 @@ function showNotification(message, type = 'info') {
 
 // Track if listeners are already attached to prevent duplicates
 let historyFiltersInitialized = false;
+// Cursor of the next history page (null when everything is loaded)
+let historyNextCursor = null;
+let historyFilter = 'all';
 
 function loadHistory(filter = 'all') {
     // Initialize filter buttons only once
@@ -656,21 +661,13 @@ async function fetchHistory(filter = 'all') {
         
         const data = await response.json();
         const allHistory = data.history || [];
-        let history = allHistory;
-        
-        // Apply filter
-        if (filter === 'recent') {
-            const sevenDaysAgo = new Date();
-            sevenDaysAgo.setDate(sevenDaysAgo.getDate() - 7);
-            history = allHistory.filter(item => new Date(item.submitted_at) >= sevenDaysAgo);
-        } else if (filter === 'by-course') {
-            // Group by course (already sorted by date in API)
-            history = allHistory;
-        }
+        historyNextCursor = data.next_cursor || null;
+        historyFilter = filter;
+        const history = filterHistory(allHistory, filter);
         
         // Update completed count - always show total, not filtered
         const completedCountEl = document.getElementById('completedCount');
-        if (completedCountEl) completedCountEl.textContent = allHistory.length;
+        if (completedCountEl) completedCountEl.textContent = data.total ?? allHistory.length;
         
         // Update UI
         if (history.length === 0) {
@@ -681,6 +678,7 @@ async function fetchHistory(filter = 'all') {
             historyList.style.display = 'block';
             renderHistory(history);
         }
+        renderHistoryLoadMore();
         
         // Hide loading overlay
         if (loadingOverlay) loadingOverlay.style.display = 'none';
@@ -699,6 +697,65 @@ async function fetchHistory(filter = 'all') {
     }
 }
 
+function filterHistory(items, filter) {
+    if (filter === 'recent') {
+        const sevenDaysAgo = new Date();
+        sevenDaysAgo.setDate(sevenDaysAgo.getDate() - 7);
+        return items.filter(item => new Date(item.submitted_at) >= sevenDaysAgo);
+    }
+    // 'by-course' keeps the API order (latest first)
+    return items;
+}
+
+function renderHistoryLoadMore() {
+    const historyList = document.getElementById('historyList');
+    if (!historyList) return;
+    
+    const existing = document.getElementById('historyLoadMore');
+    if (existing) existing.remove();
+    if (!historyNextCursor) return;
+    
+    const button = document.createElement('button');
+    button.id = 'historyLoadMore';
+    button.className = 'filter-btn';
+    button.style.cssText = 'display: block; margin: 16px auto;';
+    button.innerHTML = '<i class="fas fa-chevron-down"></i> Load more';
+    button.addEventListener('click', loadMoreHistory);
+    historyList.style.display = 'block';
+    historyList.appendChild(button);
+}
+
+async function loadMoreHistory() {
+    const button = document.getElementById('historyLoadMore');
+    if (button) button.disabled = true;
+    
+    try {
+        const response = await fetch(`/api/student/evaluation-history/?cursor=${encodeURIComponent(historyNextCursor)}`);
+        if (!response.ok) {
+            throw new Error('Failed to load more history');
+        }
+        
+        const data = await response.json();
+        historyNextCursor = data.next_cursor || null;
+        
+        const historyList = document.getElementById('historyList');
+        const fragment = document.createDocumentFragment();
+        filterHistory(data.history || [], historyFilter).forEach(item => {
+            fragment.appendChild(createHistoryCard(item));
+        });
+        if (button) button.remove();
+        historyList.appendChild(fragment);
+        
+        if (historyList.children.length > 0) {
+            document.getElementById('emptyStateHistory').style.display = 'none';
+        }
+        renderHistoryLoadMore();
+    } catch (error) {
+        console.error('Error loading more history:', error);
+        if (button) button.disabled = false;
+    }
+}
+
 function renderHistory(history) {
     const historyList = document.getElementById('historyList');
     if (!historyList) return;
@@ -756,18 +813,24 @@ function createHistoryCard(item) {
             <p class="history-card__description">${escapeHtml(truncatedDesc)}</p>
         </div>
         <div class="history-card__footer">
+            ${item.queued ? `
+            <span class="history-card__badge">
+                <i class="fas fa-hourglass-half"></i> Processing
+            </span>` : `
             <span class="history-card__badge">
                 <i class="fas fa-calendar-check"></i> Completed
             </span>
             <button class="btn--view-details" data-response-id="${item.response_id}">
                 <i class="fas fa-eye"></i> View Details
-            </button>
+            </button>`}
         </div>
     `;
     
-    // Add click handler for view details button
+    // Add click handler for view details button (queued submissions have no details yet)
     const viewBtn = card.querySelector('.btn--view-details');
-    viewBtn.addEventListener('click', () => openEvaluationModal(item.response_id));
+    if (viewBtn) {
+        viewBtn.addEventListener('click', () => openEvaluationModal(item.response_id));
+    }
     
     return card;
 }
@@ -1068,6 +1131,14 @@ function updateTopNavAvatar(imageUrl) {
 
 let searchTimeout = null;
 let currentSearchIndex = -1;
+// Only the latest search may render its results
+let searchSequence = 0;
+// Form ids in the student's pending list, used to badge autocomplete results
+let pendingFormIds = new Set();
+
+function rememberPendingForms(pendingEvaluations) {
+    pendingFormIds = new Set((pendingEvaluations || []).map(e => e.form_id));
+}
 
 function initSearch() {
     const searchInput = document.getElementById('searchInput');
@@ -1208,8 +1279,23 @@ function handleSearch(event) {
     }
 }
 
-async function performSearch(query) {
+async function fetchFormResults(query, ranked) {
+    // Autocomplete matches word prefixes in memory; the ranked search also finds
+    // substrings and typos and is used on Enter or when autocomplete finds nothing
+    if (!ranked) {
+        const response = await fetch(`/forms/autocomplete/?q=${encodeURIComponent(query)}`);
+        const data = await response.json();
+        const results = (data.results || []).map(form => ({ ...form, is_pending: pendingFormIds.has(form.id) }));
+        if (results.length > 0) return results;
+    }
+    const response = await fetch(`/forms/search/?q=${encodeURIComponent(query)}`);
+    const data = await response.json();
+    return data.results || [];
+}
+
+async function performSearch(query, ranked = false) {
     const searchResults = document.getElementById('searchResults');
+    const sequence = ++searchSequence;
     
     // Show loading state
     searchResults.innerHTML = `
@@ -1223,16 +1309,16 @@ async function performSearch(query) {
 
     try {
         // Search both forms and history in parallel
-        const [formsResponse, historyResponse] = await Promise.all([
-            fetch(`/forms/search/?q=${encodeURIComponent(query)}`),
+        const [forms, historyResponse] = await Promise.all([
+            fetchFormResults(query, ranked),
             fetch(`/api/student/evaluation-history/`)
         ]);
 
-        const formsData = await formsResponse.json();
         const historyData = await historyResponse.json();
+        if (sequence !== searchSequence) return;
 
         // Store forms data globally for passcode checking
-        window.searchFormData = formsData.results || [];
+        window.searchFormData = forms;
 
         // Filter history by query
         const filteredHistory = historyData.history.filter(item => 
@@ -1241,8 +1327,9 @@ async function performSearch(query) {
             item.team_identifier.toLowerCase().includes(query.toLowerCase())
         );
 
-        renderSearchResults(formsData.results || [], filteredHistory);
+        renderSearchResults(forms, filteredHistory);
     } catch (error) {
+        if (sequence !== searchSequence) return;
         console.error('Search error:', error);
         searchResults.innerHTML = `
             <div class="search-results__empty">
@@ -1362,6 +1449,17 @@ function handleSearchKeydown(event) {
     const searchResults = document.getElementById('searchResults');
     const items = searchResults.querySelectorAll('.search-result-item');
     
+    // Enter without a highlighted result runs the full ranked search
+    if (event.key === 'Enter' && !(currentSearchIndex >= 0 && items[currentSearchIndex])) {
+        const query = event.target.value.trim();
+        event.preventDefault();
+        if (query.length > 0) {
+            clearTimeout(searchTimeout);
+            performSearch(query, true);
+        }
+        return;
+    }
+    
     if (items.length === 0) return;
 
     switch(event.key) {